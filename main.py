@@ -10,137 +10,11 @@ from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.utils import get_color_from_hex
 from kivy.metrics import dp, sp
-import random
-import math
-import numpy as np
-from maze_generator import MazeGenerator
-from maze_solver import MazeSolver
-
-class MobilePlayer:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.target_x = x
-        self.target_y = y
-        self.moving = False
-        self.move_progress = 0
-        self.move_speed = 0.3
-        self.moves_count = 0
-        self.level_start_time = 0
-        self.level_complete_time = 0
-        
-    def set_target(self, target_x, target_y):
-        self.target_x = target_x
-        self.target_y = target_y
-        self.moving = True
-        self.move_progress = 0
-        self.moves_count += 1
-    
-    def update(self):
-        if self.moving:
-            self.move_progress += self.move_speed
-            if self.move_progress >= 1:
-                self.x = self.target_x
-                self.y = self.target_y
-                self.moving = False
-            else:
-                self.x = self.x + (self.target_x - self.x) * self.move_speed
-                self.y = self.y + (self.target_y - self.y) * self.move_speed
-    
-    def reset(self, x, y):
-        self.x = x
-        self.y = y
-        self.target_x = x
-        self.target_y = y
-        self.moving = False
-        self.move_progress = 0
-        self.moves_count = 0
-
-class MobileSnake:
-    def __init__(self, x, y, maze, start_delay=10000):
-        self.x = x
-        self.y = y
-        self.target_x = x
-        self.target_y = y
-        self.moving = False
-        self.move_progress = 0
-        self.move_speed = 0.08
-        self.maze = maze
-        self.solver = MazeSolver(maze)
-        self.path = []
-        self.update_counter = 0
-        self.update_frequency = 6
-        self.active = False
-        self.activation_time = 0
-        self.start_delay = start_delay
-        
-    def update_path(self, player_x, player_y):
-        if not self.active:
-            return
-            
-        self.update_counter += 1
-        if self.update_counter >= self.update_frequency:
-            self.update_counter = 0
-            start = (int(self.x), int(self.y))
-            end = (int(player_x), int(player_y))
-            self.path, _ = self.solver.solve_bfs(start, end)
-            
-            if self.path and len(self.path) > 1:
-                self.path = self.path[1:]
-    
-    def update(self, player_x, player_y, current_time):
-        if not self.active and current_time >= self.activation_time:
-            self.active = True
-        
-        if self.active:
-            self.update_path(player_x, player_y)
-            
-            if not self.moving and self.path:
-                next_x, next_y = self.path[0]
-                
-                if (0 <= next_x < self.maze.shape[1] and 
-                    0 <= next_y < self.maze.shape[0] and 
-                    self.maze[next_y][next_x] == 0):
-                    
-                    self.target_x = next_x
-                    self.target_y = next_y
-                    self.moving = True
-                    self.move_progress = 0
-                    self.path = self.path[1:]
-            
-            if self.moving:
-                self.move_progress += self.move_speed
-                if self.move_progress >= 1:
-                    self.x = self.target_x
-                    self.y = self.target_y
-                    self.moving = False
-                else:
-                    self.x = self.x + (self.target_x - self.x) * self.move_speed
-                    self.y = self.y + (self.target_y - self.y) * self.move_speed
-    
-    def reset(self, x, y, start_delay=10000):
-        self.x = x
-        self.y = y
-        self.target_x = x
-        self.target_y = y
-        self.moving = False
-        self.move_progress = 0
-        self.path = []
-        self.update_counter = 0
-        self.active = False
-        self.start_delay = start_delay
-        self.activation_time = 0
-    
-    def check_collision(self, player_x, player_y):
-        if not self.active:
-            return False
-        return (abs(self.x - player_x) < 0.5 and abs(self.y - player_y) < 0.5)
-    
-    def get_activation_countdown(self, current_time):
-        if self.active:
-            return 0
-        time_left = max(0, self.activation_time - current_time)
-        return time_left // 1000
+from kivy.storage.jsonstore import JsonStore
+import os
+from maze_grid import maze_array
+from maze_cache import MazeCache
+from maze_sim import MobileMazeGame
 
 class MazeWidget(GridLayout):
     def __init__(self, game, **kwargs):
@@ -198,7 +72,7 @@ class MazeWidget(GridLayout):
                 self._draw_maze()
     
     def _draw_maze(self):
-        maze = self.game.maze
+        maze = maze_array(self.game.maze)
         height, width = maze.shape
         
         # Calculate scaling to fit maze in available space
@@ -244,148 +118,38 @@ class MazeWidget(GridLayout):
         Color(0.86, 0.08, 0.24, 1)
         Rectangle(pos=(end_x_pos, end_y_pos), size=(cell_width, cell_width))
         
+        # Moving pieces are drawn between the last two simulation ticks
+        alpha = self.game.alpha
+        
         # Draw player
         if self.game.player:
-            player_x = start_x + self.game.player.x * cell_width
-            player_y = start_y + (height - 1 - self.game.player.y) * cell_width
+            px, py = self.game.player.render_position(alpha)
+            player_x = start_x + px * cell_width
+            player_y = start_y + (height - 1 - py) * cell_width
             Color(0.25, 0.41, 0.88, 1)
             Ellipse(pos=(player_x + cell_width/4, player_y + cell_width/4), 
                    size=(cell_width/2, cell_width/2))
         
         # Draw snake
         if self.game.snake:
-            snake_x = start_x + self.game.snake.x * cell_width
-            snake_y = start_y + (height - 1 - self.game.snake.y) * cell_width
+            sx, sy = self.game.snake.render_position(alpha)
+            snake_x = start_x + sx * cell_width
+            snake_y = start_y + (height - 1 - sy) * cell_width
             if self.game.snake.active:
                 Color(0.2, 0.8, 0.2, 1)
             else:
                 Color(0.6, 0.6, 0.4, 1)
             Ellipse(pos=(snake_x + cell_width/4, snake_y + cell_width/4), 
                    size=(cell_width/2, cell_width/2))
-
-class MobileMazeGame:
-    def __init__(self):
-        self.maze = None
-        self.player = None
-        self.snake = None
-        self.game_state = "menu"
-        self.current_level = 1
-        self.max_level = 10
-        self.show_hint = False
-        self.hint_path = None
-        self.game_started = False
-        self.start_time = 0
-        
-        self.level_configs = {
-            1: {"size": 11, "algorithm": "dfs", "snake_speed": 0.08, "snake_freq": 6, "snake_delay": 10000},
-            2: {"size": 11, "algorithm": "dfs", "snake_speed": 0.10, "snake_freq": 5, "snake_delay": 9000},
-            3: {"size": 15, "algorithm": "dfs", "snake_speed": 0.12, "snake_freq": 5, "snake_delay": 8000},
-            4: {"size": 15, "algorithm": "prims", "snake_speed": 0.14, "snake_freq": 4, "snake_delay": 7000},
-            5: {"size": 19, "algorithm": "prims", "snake_speed": 0.16, "snake_freq": 4, "snake_delay": 6000},
-            6: {"size": 19, "algorithm": "prims", "snake_speed": 0.18, "snake_freq": 3, "snake_delay": 5000},
-            7: {"size": 21, "algorithm": "division", "snake_speed": 0.20, "snake_freq": 3, "snake_delay": 4000},
-            8: {"size": 23, "algorithm": "division", "snake_speed": 0.22, "snake_freq": 2, "snake_delay": 3000},
-            9: {"size": 25, "algorithm": "division", "snake_speed": 0.24, "snake_freq": 2, "snake_delay": 2000},
-            10: {"size": 27, "algorithm": "division", "snake_speed": 0.26, "snake_freq": 1, "snake_delay": 1000}
-        }
-    
-    def start_level(self, level):
-        self.current_level = level
-        config = self.level_configs[level]
-        size = config["size"]
-        
-        generator = MazeGenerator(size, size)
-        
-        if config["algorithm"] == "dfs":
-            self.maze = generator.generate_dfs()
-        elif config["algorithm"] == "prims":
-            self.maze = generator.generate_prims()
-        else:
-            self.maze = generator.generate_division()
-        
-        solver = MazeSolver(self.maze)
-        start_pos, end_pos = generator.get_start_end()
-        
-        # Initialize player
-        if not self.player:
-            self.player = MobilePlayer(start_pos[0], start_pos[1])
-        else:
-            self.player.reset(start_pos[0], start_pos[1])
-        
-        # Initialize snake
-        self.snake = MobileSnake(start_pos[0], start_pos[1], self.maze, config["snake_delay"])
-        self.snake.move_speed = config["snake_speed"]
-        self.snake.update_frequency = config["snake_freq"]
-        
-        # Generate hint path
-        path, _ = solver.solve_bfs(start_pos, end_pos)
-        self.hint_path = [(int(x), int(y)) for x, y in path] if path else []
-        
-        self.game_started = False
-        self.game_state = "playing"
-        self.start_time = 0
-    
-    def move_player(self, direction):
-        if not self.player or self.player.moving or self.game_state != "playing":
-            return
-        
-        x, y = int(round(self.player.x)), int(round(self.player.y))
-        new_x, new_y = x, y
-        
-        if direction == "up":
-            new_y += 1
-        elif direction == "down":
-            new_y -= 1
-        elif direction == "left":
-            new_x -= 1
-        elif direction == "right":
-            new_x += 1
-        
-        # Check if move is valid
-        if (0 <= new_x < self.maze.shape[1] and 
-            0 <= new_y < self.maze.shape[0] and 
-            self.maze[new_y][new_x] == 0):
-            
-            # Start game on first move
-            if not self.game_started:
-                self.game_started = True
-                self.start_time = Clock.get_time() * 1000
-                self.snake.activation_time = self.start_time + self.snake.start_delay
-            
-            self.player.set_target(new_x, new_y)
-            return True
-        return False
-    
-    def update(self, dt):
-        if self.game_state == "playing" and self.game_started:
-            current_time = Clock.get_time() * 1000
-            
-            # Update player
-            self.player.update()
-            
-            # Update snake
-            if self.snake:
-                self.snake.update(self.player.x, self.player.y, current_time)
-            
-            # Check win condition
-            start_pos, end_pos = (0, 1), (self.maze.shape[1]-1, self.maze.shape[0]-2)
-            player_pos = (int(round(self.player.x)), int(round(self.player.y)))
-            if player_pos == end_pos and not self.player.moving:
-                self.game_state = "level_complete"
-                return True
-            
-            # Check game over
-            if self.snake and self.snake.check_collision(self.player.x, self.player.y):
-                self.game_state = "game_over"
-                return True
         
-        return False
-    
-    def get_level_time(self):
-        if not self.game_started:
-            return 0
-        current_time = Clock.get_time() * 1000
-        return max(0, (current_time - self.start_time) // 1000)
+        # Draw extra enemies
+        if self.game.enemies:
+            Color(0.8, 0.4, 0.1, 1)
+            for enemy_x, enemy_y in self.game.enemies.render_positions(alpha).tolist():
+                ex = start_x + enemy_x * cell_width
+                ey = start_y + (height - 1 - enemy_y) * cell_width
+                Ellipse(pos=(ex + cell_width/4, ey + cell_width/4),
+                       size=(cell_width/2, cell_width/2))
 
 class MazeApp(App):
     def __init__(self, **kwargs):
@@ -403,6 +167,16 @@ class MazeApp(App):
         from kivy.config import Config
         Config.set('input', 'mouse', 'mouse,multitouch_on_demand')
         
+        # Keep generated mazes on disk between sessions. The level seeds are
+        # saved as well, or every session would ask for new mazes.
+        self.game.maze_cache = MazeCache(cache_dir=os.path.join(self.user_data_dir, 'mazes'))
+        store = JsonStore(os.path.join(self.user_data_dir, 'game.json'))
+        if store.exists('level_seeds'):
+            saved = store.get('level_seeds')
+            self.game.level_seeds.update((int(level), seed) for level, seed in saved.items())
+        store.put('level_seeds', **{str(level): self.game._level_seed(level)
+                                    for level in self.game.level_configs})
+        
         # Create main layout
         main_layout = BoxLayout(orientation='vertical', spacing=dp(10), padding=dp(10))
         
@@ -0,0 +1,253 @@
+import hashlib
+import os
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+from maze_grid import frozen_array, maze_array
+
+
+class MazeCache:
+    """Two-level cache of generated mazes keyed by (algorithm, width, height, seed).
+
+    Mazes are deterministic for a given key, so a hit can be served instead
+    of regenerating. The first level is an in-memory LRU of ``max_items``
+    arrays. The optional second level stores ``.npy`` files in ``cache_dir``
+    and loads them memory-mapped; when the directory grows past
+    ``max_disk_bytes`` the least recently used files are deleted.
+    """
+
+    def __init__(self, max_items=16, cache_dir=None, max_disk_bytes=64 * 1024 * 1024):
+        self.max_items = max_items
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()  # Levels may be prefetched from a worker thread
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(algorithm, width, height, seed):
+        return (algorithm, int(width), int(height), int(seed))
+
+    def _path(self, key):
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest + ".npy")
+
+    def get(self, key):
+        """Return the cached maze for key, or None."""
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key):
+        maze = self._memory.get(key)
+        if maze is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return maze
+
+        if self.cache_dir:
+            path = self._path(key)
+            try:
+                maze = np.load(path, mmap_mode="r")
+            except (OSError, ValueError):
+                maze = None
+            if maze is not None:
+                os.utime(path)  # Mark as recently used for eviction
+                self._remember(key, maze)
+                self.hits += 1
+                return maze
+
+        self.misses += 1
+        return None
+
+    def put(self, key, maze):
+        """Store a frozen copy of a maze in memory and, if configured, on disk."""
+        with self._lock:
+            return self._put(key, maze)
+
+    def _put(self, key, maze):
+        maze = frozen_array(maze)  # The caller's array stays writeable
+        self._remember(key, maze)
+
+        if self.cache_dir:
+            path = self._path(key)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, maze)
+            os.replace(tmp_path, path)
+            self._evict_disk()
+        return maze
+
+    def get_or_generate(self, generator, algorithm):
+        """Return a maze for a seeded MazeGenerator, generating only on a miss.
+
+        Unseeded generators are not reproducible and bypass the cache.
+        """
+        if generator.seed is None:
+            return generator.generate(algorithm)
+
+        key = self.make_key(algorithm, generator.width, generator.height, generator.seed)
+        maze = self.get(key)
+        if maze is None:
+            maze = self.put(key, generator.generate(algorithm))
+        generator.maze = maze
+        return maze
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+
+    def _remember(self, key, maze):
+        self._memory[key] = maze
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".npy"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+def _immutable_root(cells):
+    """The ndarray owning cells' data if nothing can ever write it, else None
+
+    Every array on the base chain must be read-only and the chain must end
+    in a read-only buffer (bytes, a read-only mmap). An array that owns its
+    data does not qualify: it can simply be made writeable again.
+    """
+    root, base = None, cells
+    while isinstance(base, np.ndarray):
+        if base.flags.writeable:
+            return None
+        root, base = base, base.base
+    if base is None:
+        return None
+    try:
+        with memoryview(base) as view:
+            return root if view.readonly else None
+    except TypeError:
+        return None
+
+
+class SolveCache:
+    """LRU memo of solver paths keyed by (maze fingerprint, algorithm, start, end).
+
+    The fingerprint is a BLAKE2 hash of the maze contents, recomputed on
+    each lookup, so editing a maze in place gives it a new key and stale
+    results are never served; old entries simply age out. Only arrays whose
+    data nothing can write (``frozen_array`` copies such as MazeCache
+    entries and unpacked MazeGrids, or read-only memmaps) have their hash
+    remembered, for as long as the data lives. One ``MazeSolver`` is kept
+    per recent fingerprint so misses do not rebuild it either. Only paths are
+    cached, not the visited cells.
+    """
+
+    def __init__(self, max_items=256, max_solvers=4):
+        self.max_items = max_items
+        self.max_solvers = max_solvers
+        self._paths = OrderedDict()
+        self._solvers = OrderedDict()
+        self._digests = {}  # (id(root), view geometry) -> (weakref to root, fingerprint)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _digest(cells):
+        cells = np.ascontiguousarray(cells)
+        digest = hashlib.blake2b(cells.data, digest_size=16).hexdigest()
+        return (cells.shape, cells.dtype.str, digest)
+
+    def fingerprint(self, maze):
+        cells = maze_array(maze)
+        root = _immutable_root(cells)
+        if root is None:
+            return self._digest(cells)
+
+        # Views share their root, so key on it plus where the view points
+        key = (id(root), cells.__array_interface__["data"][0], cells.shape,
+               cells.strides, cells.dtype.str)
+        with self._lock:
+            entry = self._digests.get(key)
+        if entry is not None and entry[0]() is root:
+            return entry[1]
+        fingerprint = self._digest(cells)
+        ref = weakref.ref(root, lambda _, key=key: self._digests.pop(key, None))
+        with self._lock:
+            self._digests[key] = (ref, fingerprint)
+        return fingerprint
+
+    def solve(self, maze, start, end, algorithm="bfs"):
+        """Path from start to end, solving with ``solve_<algorithm>`` on a miss."""
+        fingerprint = self.fingerprint(maze)
+        key = (fingerprint, algorithm, tuple(start), tuple(end))
+        with self._lock:
+            path = self._paths.get(key)
+            if path is not None:
+                self._paths.move_to_end(key)
+                self.hits += 1
+                return list(path)
+            self.misses += 1
+            solver = self._solver(fingerprint, maze)
+
+        method = getattr(solver, "solve_" + algorithm, None)
+        if method is None:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        path, _ = method(start, end)
+
+        with self._lock:
+            self._paths[key] = tuple(path)
+            self._paths.move_to_end(key)
+            while len(self._paths) > self.max_items:
+                self._paths.popitem(last=False)
+        return list(path)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses,
+                    "hit_rate": self.hits / total if total else 0.0,
+                    "entries": len(self._paths)}
+
+    def clear(self):
+        with self._lock:
+            self._paths.clear()
+            self._solvers.clear()
+            self._digests.clear()
+
+    def _solver(self, fingerprint, maze):
+        from maze_solver import MazeSolver
+
+        solver = self._solvers.get(fingerprint)
+        if solver is None:
+            # Copy so later edits to the caller's array cannot leak in
+            solver = MazeSolver(np.array(maze_array(maze)))
+            self._solvers[fingerprint] = solver
+        self._solvers.move_to_end(fingerprint)
+        while len(self._solvers) > self.max_solvers:
+            self._solvers.popitem(last=False)
+        return solver
@@ -0,0 +1,142 @@
+import numpy as np
+
+from maze_grid import maze_array, neighbor_masks
+
+# Moves in neighbour-mask bit order: right, left, down, up
+STEP_X = np.array([1, -1, 0, 0], dtype=np.int32)
+STEP_Y = np.array([0, 0, 1, -1], dtype=np.int32)
+STEP_BITS = np.array([1, 2, 4, 8], dtype=np.uint8)
+
+
+class EnemySwarm:
+    """Any number of maze enemies stored as parallel NumPy arrays.
+
+    Where MobileSnake is one Python object per enemy, here every piece of
+    state (cell, target cell, move progress, speed, activation time) is an
+    array with one entry per enemy, and ``update`` advances all of them with
+    a fixed number of vectorized operations. Frame cost therefore stays
+    nearly flat as the enemy count grows. Idle enemies pick their next cell
+    with the biased random walk of ``Snake._choose_biased_move``; given a
+    shared FlowField, the closer move is the field's next step through the
+    maze instead of the one with a smaller Manhattan distance.
+    """
+
+    def __init__(self, maze, positions, start_delay=10000, move_speed=4.8,
+                 bias_factor=0.0, rng=None, masks=None, flow=None):
+        self.maze = maze_array(maze)
+        self.masks = neighbor_masks(self.maze) if masks is None else masks
+        positions = np.asarray(positions, dtype=np.int32).reshape(-1, 2)
+        count = len(positions)
+
+        self.x = positions[:, 0].copy()
+        self.y = positions[:, 1].copy()
+        self.target_x = self.x.copy()
+        self.target_y = self.y.copy()
+        self.progress = np.zeros(count)
+        self.moving = np.zeros(count, dtype=bool)
+        self.active = np.zeros(count, dtype=bool)
+        self.previous = positions.astype(float)  # Positions before the last tick
+
+        # Scalars or per-enemy arrays; speeds are in cells per second
+        self.speed = np.broadcast_to(np.asarray(move_speed, dtype=float), (count,)).copy()
+        self.start_delay = np.broadcast_to(np.asarray(start_delay, dtype=float), (count,)).copy()
+        self.activation_time = np.full(count, np.inf)
+        self.bias_factor = bias_factor
+        self.flow = flow
+        self.random = rng if rng is not None else np.random.default_rng()
+
+    @classmethod
+    def spawn(cls, maze, count, avoid=None, min_distance=0, rng=None, **kwargs):
+        """Place count enemies on random open cells
+
+        Cells closer than ``min_distance`` (Manhattan) to ``avoid`` are
+        skipped, unless that leaves nowhere to spawn.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        cells_y, cells_x = np.nonzero(maze_array(maze) == 0)
+        if avoid is not None and min_distance > 0:
+            far = np.abs(cells_x - avoid[0]) + np.abs(cells_y - avoid[1]) >= min_distance
+            if far.any():
+                cells_x, cells_y = cells_x[far], cells_y[far]
+        picks = rng.integers(len(cells_x), size=count)
+        positions = np.column_stack((cells_x[picks], cells_y[picks]))
+        return cls(maze, positions, rng=rng, **kwargs)
+
+    def __len__(self):
+        return len(self.x)
+
+    def start(self, current_time):
+        """Begin each enemy's start delay from current_time"""
+        self.activation_time = current_time + self.start_delay
+
+    def update(self, player_x, player_y, current_time, dt):
+        """Advance every enemy by dt seconds (one tick)"""
+        self.previous = self.positions()
+        self.active |= current_time >= self.activation_time
+        if self.flow is not None:
+            self.flow.update((player_x, player_y))  # No-op unless the player changed cell
+
+        idle = np.flatnonzero(self.active & ~self.moving)
+        if idle.size:
+            self._choose_moves(idle, player_x, player_y)
+
+        # Step every moving enemy towards its target cell
+        moving = self.moving
+        self.progress[moving] += self.speed[moving] * dt
+        arrived = moving & (self.progress >= 1)
+        self.x[arrived] = self.target_x[arrived]
+        self.y[arrived] = self.target_y[arrived]
+        self.progress[arrived] = 0
+        moving[arrived] = False
+
+    def _choose_moves(self, idle, player_x, player_y):
+        """Biased random choice of the next cell for the enemies in idle"""
+        x, y = self.x[idle], self.y[idle]
+        open_ = (self.masks[y, x][:, None] & STEP_BITS) != 0
+        next_x = x[:, None] + STEP_X
+        next_y = y[:, None] + STEP_Y
+
+        # Closer moves gain bias_factor, farther ones lose half of it
+        if self.flow is not None:
+            # The flow field's step is closer and the rest farther; enemies
+            # with no step (on the player or cut off) weigh all moves equally
+            best = self.flow.directions[y, x][:, None]
+            change = np.where(best == 0, 0, np.where(best == STEP_BITS, -1, 1))
+        else:
+            current = (np.abs(x - player_x) + np.abs(y - player_y))[:, None]
+            new = np.abs(next_x - player_x) + np.abs(next_y - player_y)
+            change = np.sign(new - current)
+        bias = self.bias_factor
+        weights = np.where(change < 0, 1.0 + bias, np.where(change > 0, 1.0 - bias / 2, 1.0))
+        weights = np.maximum(weights, 0.1) * open_
+
+        # Inverse-CDF sampling, one uniform draw per enemy
+        cumulative = np.cumsum(weights, axis=1)
+        total = cumulative[:, -1]
+        draw = self.random.random(len(idle)) * total
+        choice = np.minimum((cumulative <= draw[:, None]).sum(axis=1), 3)
+
+        can_move = total > 0  # Enemies boxed in by walls stay put
+        idle, choice = idle[can_move], choice[can_move]
+        rows = np.flatnonzero(can_move)
+        self.target_x[idle] = next_x[rows, choice]
+        self.target_y[idle] = next_y[rows, choice]
+        self.moving[idle] = True
+        self.progress[idle] = 0
+
+    def positions(self):
+        """Interpolated (x, y) float positions, one row per enemy"""
+        x = self.x + (self.target_x - self.x) * self.progress
+        y = self.y + (self.target_y - self.y) * self.progress
+        return np.column_stack((x, y))
+
+    def render_positions(self, alpha):
+        """Positions blended between the last two ticks"""
+        return self.previous + (self.positions() - self.previous) * alpha
+
+    def check_collision(self, player_x, player_y):
+        """True if any active enemy is within half a cell of the player"""
+        positions = self.positions()
+        near = ((np.abs(positions[:, 0] - player_x) < 0.5) &
+                (np.abs(positions[:, 1] - player_y) < 0.5))
+        return bool((near & self.active).any())
@@ -1,34 +1,140 @@
+import os
 import random
 import numpy as np
+from array import array
 from collections import deque
+from itertools import permutations
+from maze_grid import MazeGrid
+
+
+def _direction_orders(width):
+    """All 24 orderings of the four two-cell steps on a flat grid"""
+    return list(permutations((2, 2 * width, -2, -2 * width)))
+
+
+def _padded_grid(width, height):
+    """Flat bytearray of uncarved walls (1) with a padding row above and below
+
+    The padding rows and the first and last columns are 2, a border that
+    the carving loops can never enter.
+    """
+    grid = bytearray(b'\x01') * ((height + 2) * width)
+    grid[:2 * width] = b'\x02' * (2 * width)
+    grid[height * width:] = b'\x02' * (2 * width)
+    grid[width::width] = b'\x02' * (height + 1)
+    grid[2 * width - 1::width] = b'\x02' * (height + 1)
+    return grid
+
+
+def _boruvka_rounds(first, second, nodes, stop):
+    """Vectorized Boruvka contraction of a graph with edges in rank order
+
+    ``first`` and ``second`` hold the two end nodes of each edge, lowest
+    rank first. Each round every component takes its lowest-ranked edge
+    to another component, all at once with NumPy; with distinct ranks these
+    are exactly edges Kruskal's algorithm would accept. A round at least
+    halves the component count. Stops once at most ``stop`` edges still
+    join two components and returns (component label of each node, chosen
+    edge positions, positions of the edges left).
+    """
+    labels = np.arange(nodes)
+    left = np.arange(len(first))
+    chosen = np.zeros(len(first), dtype=bool)
+    while True:
+        a, b = labels[first], labels[second]
+        cross = a != b
+        first, second, left, a, b = first[cross], second[cross], left[cross], a[cross], b[cross]
+        if len(left) <= stop:
+            break
+        
+        # Edges are in rank order, so the lowest index is the lowest rank
+        index = np.arange(len(left))
+        best = np.full(nodes, len(left))
+        np.minimum.at(best, a, index)
+        np.minimum.at(best, b, index)
+        comps = np.flatnonzero(best < len(left))
+        pick = best[comps]
+        chosen[left[pick]] = True
+        
+        # Hook each component onto the far end of its edge. Two components
+        # that picked the same edge point at each other; the lower one
+        # becomes the root. Pointer jumping then flattens every tree.
+        target = np.where(a[pick] == comps, b[pick], a[pick])
+        hook = np.arange(nodes)
+        hook[comps] = target
+        root = (hook[target] == comps) & (comps < target)
+        hook[comps[root]] = comps[root]
+        while True:
+            jumped = hook[hook]
+            if np.array_equal(jumped, hook):
+                break
+            hook = jumped
+        labels = hook[labels]
+    return labels, np.flatnonzero(chosen), left
+
 
 class MazeGenerator:
-    def __init__(self, width, height):
+    def __init__(self, width, height, seed=None):
         # Ensure dimensions are odd for proper maze generation
         self.width = width if width % 2 == 1 else width + 1
         self.height = height if height % 2 == 1 else height + 1
         self.maze = None
+        
+        # Per-instance RNGs so the same seed always gives the same maze
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.np_random = np.random.default_rng(seed)
+    
+    def generate(self, algorithm):
+        """Generate a maze by algorithm name ("dfs", "prims", ...)"""
+        method = getattr(self, "generate_" + algorithm, None)
+        if method is None:
+            raise ValueError(f"Unknown maze algorithm: {algorithm}")
+        return method()
     
     def generate_dfs(self):
-        """Depth-First Search with recursive backtracking"""
-        # Initialize maze with walls
-        maze = np.ones((self.height, self.width), dtype=int)
-        
-        def carve_path(x, y):
-            maze[y][x] = 0  # Mark as path
-            directions = [(2,0), (0,2), (-2,0), (0,-2)]
-            random.shuffle(directions)
-            
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if 0 < nx < self.width-1 and 0 < ny < self.height-1 and maze[ny][nx] == 1:
-                    # Carve path between current cell and next cell
-                    maze[y + dy//2][x + dx//2] = 0
-                    carve_path(nx, ny)
-        
-        # Start from top-left (ensure odd coordinates)
-        start_x, start_y = 1, 1
-        carve_path(start_x, start_y)
+        """Depth-First Search with iterative backtracking
+
+        Uses an explicit stack instead of recursion, so maze size is not
+        limited by Python's recursion limit. Each cell gets a uniformly random
+        order of its four directions, exactly like the old recursive version,
+        so the distribution of mazes is unchanged.
+
+        Work is done on a flat bytearray with a padding row above and below,
+        which keeps the hot loop free of bounds checks and NumPy scalar
+        indexing. Throughput target: at least 2 million grid cells per second
+        on CPython 3.10+, i.e. a 4001x4001 maze in under 10 seconds.
+        """
+        width, height = self.width, self.height
+        
+        # 1 = uncarved wall, 2 = border/padding that can never be carved
+        grid = _padded_grid(width, height)
+        
+        # Cells live on odd coordinates; steps jump two grid cells at a time
+        orders = _direction_orders(width)
+        choose = self.random.randrange
+        
+        # Start from top-left (ensure odd coordinates), offset by padding row
+        start = 2 * width + 1
+        grid[start] = 0
+        stack = [(start, list(orders[choose(24)]))]
+        
+        while stack:
+            cell, directions = stack[-1]
+            if not directions:
+                stack.pop()
+                continue
+            
+            step = directions.pop()
+            nxt = cell + step
+            if grid[nxt] == 1:
+                # Carve path between current cell and next cell
+                grid[cell + step // 2] = 0
+                grid[nxt] = 0
+                stack.append((nxt, list(orders[choose(24)])))
+        
+        maze = np.frombuffer(grid, dtype=np.uint8)[width:(height + 1) * width]
+        maze = (maze.reshape(height, width) != 0).astype(np.uint8)
         
         # FIXED: Create proper entrance and exit
         maze[1][0] = 0  # Entrance - left side
@@ -38,35 +144,51 @@ class MazeGenerator:
         return maze
     
     def generate_prims(self):
-        """Prim's Algorithm for maze generation"""
-        maze = np.ones((self.height, self.width), dtype=int)
-        
-        # Start with a cell and add its walls to the list
-        start_x, start_y = 1, 1
-        maze[start_y][start_x] = 0
-        
-        walls = []
-        # Add neighboring walls of the starting cell
-        for dx, dy in [(2,0), (0,2), (-2,0), (0,-2)]:
-            nx, ny = start_x + dx, start_y + dy
-            if 0 < nx < self.width-1 and 0 < ny < self.height-1:
-                walls.append((nx, ny, start_x + dx//2, start_y + dy//2))
-        
-        while walls:
-            # Randomly select a wall
-            wall_idx = random.randint(0, len(walls)-1)
-            x, y, cx, cy = walls.pop(wall_idx)
-            
-            if maze[y][x] == 1:  # If the cell is still a wall
-                # Carve passage
-                maze[y][x] = 0
-                maze[cy][cx] = 0  # Carve between cells
-                
-                # Add new walls
-                for dx, dy in [(2,0), (0,2), (-2,0), (0,-2)]:
-                    nx, ny = x + dx, y + dy
-                    if 0 < nx < self.width-1 and 0 < ny < self.height-1 and maze[ny][nx] == 1:
-                        walls.append((nx, ny, x + dx//2, y + dy//2))
+        """Prim's Algorithm for maze generation
+
+        The frontier holds cells, not walls. A state byte per grid cell marks
+        whether a cell is already in the maze or in the frontier, so each cell
+        enters the frontier at most once, and a random frontier cell is taken
+        out with an O(1) swap-remove. Generation time is linear in cell count.
+        """
+        width, height = self.width, self.height
+        
+        # 1 = uncarved wall, 2 = border/padding, 3 = in frontier, 0 = passage
+        grid = _padded_grid(width, height)
+        
+        steps = (2, 2 * width, -2, -2 * width)
+        choose = self.random.randrange
+        
+        # Start with a cell and add its neighbours to the frontier
+        start = 2 * width + 1
+        grid[start] = 0
+        frontier = []
+        for step in steps:
+            if grid[start + step] == 1:
+                grid[start + step] = 3
+                frontier.append(start + step)
+        
+        while frontier:
+            # Randomly select a frontier cell (swap-remove)
+            idx = choose(len(frontier))
+            cell = frontier[idx]
+            frontier[idx] = frontier[-1]
+            frontier.pop()
+            
+            # Connect it to a random neighbour that is already in the maze
+            links = [step for step in steps if grid[cell + step] == 0]
+            step = links[choose(len(links))]
+            grid[cell] = 0
+            grid[cell + step // 2] = 0
+            
+            # Add new frontier cells
+            for step in steps:
+                if grid[cell + step] == 1:
+                    grid[cell + step] = 3
+                    frontier.append(cell + step)
+        
+        maze = np.frombuffer(grid, dtype=np.uint8)[width:(height + 1) * width]
+        maze = (maze.reshape(height, width) != 0).astype(np.uint8)
         
         # FIXED: Create proper entrance and exit
         maze[1][0] = 0
@@ -76,53 +198,75 @@ class MazeGenerator:
         return maze
     
     def generate_kruskals(self):
-        """Kruskal's Algorithm using union-find"""
-        maze = np.ones((self.height, self.width), dtype=int)
-        
-        # Each cell is its own set initially
-        parent = {}
-        rank = {}
-        
-        def find(cell):
-            if parent[cell] != cell:
-                parent[cell] = find(parent[cell])
-            return parent[cell]
-        
-        def union(cell1, cell2):
-            root1, root2 = find(cell1), find(cell2)
-            if root1 != root2:
-                if rank[root1] > rank[root2]:
-                    parent[root2] = root1
-                else:
-                    parent[root1] = root2
-                    if rank[root1] == rank[root2]:
-                        rank[root2] += 1
-                return True
-            return False
-        
-        # Initialize sets for each cell
-        for y in range(1, self.height-1, 2):
-            for x in range(1, self.width-1, 2):
-                cell = (x, y)
-                parent[cell] = cell
-                rank[cell] = 0
-                maze[y][x] = 0  # Make cell a passage
-        
-        # Create all possible edges between cells
-        edges = []
-        for y in range(1, self.height-1, 2):
-            for x in range(1, self.width-1, 2):
-                if x + 2 < self.width-1:
-                    edges.append(((x, y), (x+2, y), (x+1, y)))  # Horizontal edge
-                if y + 2 < self.height-1:
-                    edges.append(((x, y), (x, y+2), (x, y+1)))  # Vertical edge
-        
-        random.shuffle(edges)
-        
-        # Process edges
-        for cell1, cell2, wall in edges:
-            if union(cell1, cell2):
-                maze[wall[1]][wall[0]] = 0  # Remove wall
+        """Kruskal's Algorithm using an array-backed union-find
+
+        Cells are numbered ``cy * cells_w + cx`` and each edge is encoded as
+        ``2 * cell + d`` (d=0 east, d=1 south). Edges are shuffled with a
+        single NumPy permutation, which ranks them. Vectorized Boruvka rounds
+        (see ``_boruvka_rounds``) first carve the edges that Kruskal would
+        accept anyway until few edges still join two components; the rest go
+        through a flat int32 parent table with path halving and union by
+        rank. No per-cell tuples or dicts are ever built.
+        """
+        maze = np.ones((self.height, self.width), dtype=np.uint8)
+        cells_w = (self.width - 1) // 2
+        cells_h = (self.height - 1) // 2
+        n_cells = cells_w * cells_h
+        
+        # Every cell is a passage
+        maze[1:self.height-1:2, 1:self.width-1:2] = 0
+        
+        # All possible edges between neighbouring cells
+        cells = np.arange(n_cells, dtype=np.int64)
+        east = cells[(cells % cells_w) < cells_w - 1] * 2
+        south = cells[cells < n_cells - cells_w] * 2 + 1
+        edges = np.concatenate((east, south))
+        edges = edges[self.np_random.permutation(len(edges))]
+        
+        # Contract the grid in bulk until an eighth of the edges are left
+        first = edges >> 1
+        second = first + np.where(edges & 1, cells_w, 1)
+        labels, carved, left = _boruvka_rounds(first, second, n_cells, n_cells // 8)
+        carved = carved.tolist()
+        
+        # Finish with union-find, each cell starting in its component
+        parent = array('i', labels.astype(np.int32).tobytes())
+        rank = bytearray(n_cells)
+        remaining = int(np.count_nonzero(labels == cells)) - 1
+        for i, edge in zip(left.tolist(), edges[left].tolist()):
+            if remaining == 0:
+                break
+            a = edge >> 1
+            b = a + 1 if edge & 1 == 0 else a + cells_w
+            
+            # Find with path halving
+            up = parent[a]
+            while up != a:
+                parent[a] = a = parent[up]
+                up = parent[a]
+            up = parent[b]
+            while up != b:
+                parent[b] = b = parent[up]
+                up = parent[b]
+            if a == b:
+                continue
+            
+            # Union by rank
+            if rank[a] > rank[b]:
+                parent[b] = a
+            else:
+                parent[a] = b
+                if rank[a] == rank[b]:
+                    rank[b] += 1
+            carved.append(i)
+            remaining -= 1
+        
+        # Remove the walls of every accepted edge in one pass
+        accepted = edges[carved]
+        cell = accepted >> 1
+        wall_y = 2 * (cell // cells_w) + 1 + (accepted & 1)
+        wall_x = 2 * (cell % cells_w) + 1 + (1 - (accepted & 1))
+        maze[wall_y, wall_x] = 0
         
         # FIXED: Create proper entrance and exit
         maze[1][0] = 0
@@ -131,9 +275,202 @@ class MazeGenerator:
         self.maze = maze
         return maze
     
+    def generate_binary_tree(self):
+        """Binary Tree algorithm, vectorized over the whole grid
+
+        Every cell carves either north or east with equal probability. Cells
+        on the top row can only carve east and cells in the last column can
+        only carve north, which keeps the maze connected. All choices and
+        carving are done with NumPy array operations.
+        """
+        maze = np.ones((self.height, self.width), dtype=np.uint8)
+        cells_w = (self.width - 1) // 2
+        cells_h = (self.height - 1) // 2
+        
+        # Every cell is a passage
+        maze[1:self.height-1:2, 1:self.width-1:2] = 0
+        
+        north = self.np_random.random((cells_h, cells_w)) < 0.5
+        north[0, :] = False  # Top row must go east
+        north[:, -1] = True  # Last column must go north
+        north[0, -1] = False  # Top-right corner carves nothing
+        east = ~north
+        east[0, -1] = False
+        
+        # Walls north of a cell sit on even rows, walls east on even columns
+        cell_y, cell_x = np.nonzero(north)
+        maze[2 * cell_y, 2 * cell_x + 1] = 0
+        cell_y, cell_x = np.nonzero(east)
+        maze[2 * cell_y + 1, 2 * cell_x + 2] = 0
+        
+        maze[1][0] = 0  # Entrance - left side
+        maze[self.height-2][self.width-1] = 0  # Exit - right side
+        
+        self.maze = maze
+        return maze
+    
+    def generate_sidewinder(self):
+        """Sidewinder algorithm, vectorized over the whole grid
+
+        Each row is split into runs by random "carve east" decisions, then one
+        random cell of every run carves north. The top row is a single run
+        with no north exits. Runs, their lengths and the chosen north cells
+        are computed for all rows at once with NumPy.
+        """
+        maze = np.ones((self.height, self.width), dtype=np.uint8)
+        cells_w = (self.width - 1) // 2
+        cells_h = (self.height - 1) // 2
+        
+        # Every cell is a passage
+        maze[1:self.height-1:2, 1:self.width-1:2] = 0
+        
+        # Top row is one long corridor
+        maze[1, 2:self.width-2:2] = 0
+        
+        if cells_h > 1:
+            east = self.np_random.random((cells_h - 1, cells_w)) < 0.5
+            east[:, -1] = False
+            
+            # Carve the east walls of rows 1..cells_h-1
+            cell_y, cell_x = np.nonzero(east)
+            maze[2 * cell_y + 3, 2 * cell_x + 2] = 0
+            
+            # A run starts at column 0 or after a cell that did not go east
+            run_start = np.ones_like(east)
+            run_start[:, 1:] = ~east[:, :-1]
+            starts = np.flatnonzero(run_start)
+            lengths = np.diff(np.append(starts, east.size))
+            
+            # Pick one random cell per run to carve north
+            chosen = starts + (self.np_random.random(len(starts)) * lengths).astype(np.int64)
+            cell_y, cell_x = np.divmod(chosen, cells_w)
+            maze[2 * cell_y + 2, 2 * cell_x + 1] = 0
+        
+        maze[1][0] = 0  # Entrance - left side
+        maze[self.height-2][self.width-1] = 0  # Exit - right side
+        
+        self.maze = maze
+        return maze
+    
+    def iter_eller(self, rows=None, endless=False):
+        """Eller's algorithm as a stream of grid rows
+
+        Yields one uint8 row of ``self.width`` cells at a time, from the top
+        border down. Only the set labels of the current cell row are kept,
+        so memory is O(width) no matter how tall the maze is. ``rows`` picks
+        the total number of grid rows (default ``self.height``), rounded up
+        to odd; a ValueError is raised right away if that leaves fewer than
+        3. With ``endless=True`` rows are produced forever and the maze has
+        no bottom border or exit.
+        """
+        # Validate now rather than on the first next()
+        cells_h = None if endless else (self._eller_rows(rows) - 1) // 2
+        return self._iter_eller(cells_h)
+    
+    def _eller_rows(self, rows):
+        """Grid rows of an Eller's maze: rows (default self.height) made odd"""
+        if rows is None:
+            rows = self.height
+        rows = rows if rows % 2 == 1 else rows + 1
+        if rows < 3:
+            raise ValueError("rows must be at least 3 (two borders and a cell row)")
+        return rows
+    
+    def _iter_eller(self, cells_h):
+        endless = cells_h is None
+        width = self.width
+        cells_w = (width - 1) // 2
+        rand = self.random.random
+        
+        # Row templates: cells on odd columns, walls everywhere else
+        wall_row = np.ones(width, dtype=np.uint8)
+        yield wall_row.copy()  # Top border
+        
+        # Union-find over the current row's labels (labels are 0..cells_w-1)
+        parent = []
+        
+        def find(label):
+            while parent[label] != label:
+                parent[label] = parent[parent[label]]
+                label = parent[label]
+            return label
+        
+        sets = np.arange(cells_w)
+        cell_y = 0
+        while endless or cell_y < cells_h:
+            last_row = not endless and cell_y == cells_h - 1
+            parent[:] = range(cells_w)
+            labels = sets.tolist()
+            
+            # Randomly join adjacent cells that are in different sets
+            row = wall_row.copy()
+            row[1:width-1:2] = 0
+            for i in range(cells_w - 1):
+                a, b = find(labels[i]), find(labels[i + 1])
+                if a != b and (last_row or rand() < 0.5):
+                    parent[b] = a
+                    row[2 * i + 2] = 0
+            
+            if cell_y == 0:
+                row[0] = 0  # Entrance - left side
+            if last_row:
+                row[width-1] = 0  # Exit - right side
+            yield row
+            
+            if last_row:
+                break
+            
+            # Every set extends down at least once
+            roots = np.array([find(label) for label in labels])
+            down = self.np_random.random(cells_w) < 0.5
+            priority = self.np_random.random(cells_w)
+            order = np.lexsort((priority, roots))
+            group_last = np.append(roots[order][1:] != roots[order][:-1], True)
+            down[order[group_last]] = True
+            
+            below = wall_row.copy()
+            below[1:width-1:2] = np.where(down, 0, 1)
+            yield below
+            
+            # Cells that did not go down start fresh sets; relabel to 0..cells_w-1
+            fresh = cells_w + np.arange(cells_w)
+            _, sets = np.unique(np.where(down, roots, fresh), return_inverse=True)
+            cell_y += 1
+        
+        yield wall_row.copy()  # Bottom border
+    
+    def generate_eller(self):
+        """Eller's algorithm collected into a regular in-memory maze"""
+        maze = np.vstack(list(self.iter_eller()))
+        self.maze = maze
+        return maze
+    
+    def generate_eller_to_file(self, path, rows=None):
+        """Stream an Eller's maze straight into a memory-mapped .npy file
+
+        Only one row is held in memory at a time, so the maze can be larger
+        than RAM. Returns the read-only memory map.
+        """
+        rows = self._eller_rows(rows)
+        
+        out = np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8,
+                                        shape=(rows, self.width))
+        for y, row in enumerate(self.iter_eller(rows)):
+            out[y] = row
+        out.flush()
+        del out
+        return np.load(path, mmap_mode='r')
+    
     def generate_division(self):
-        """Recursive Division method"""
-        maze = np.zeros((self.height, self.width), dtype=int)
+        """Recursive Division method, run from an explicit work stack
+
+        Rooms wait on a stack instead of the call stack, so depth is not
+        limited by the recursion limit. Sub-rooms are pushed so they pop in
+        the old recursive order, which keeps the RNG sequence (and so the
+        maze for a given seed) the same. Each wall is drawn with a single
+        NumPy slice assignment.
+        """
+        maze = np.zeros((self.height, self.width), dtype=np.uint8)
         
         # Create border
         maze[0, :] = 1
@@ -141,43 +478,45 @@ class MazeGenerator:
         maze[:, 0] = 1
         maze[:, self.width-1] = 1
         
-        def divide(x, y, width, height):
+        rand = self.random.random
+        randrange = self.random.randrange
+        choice = self.random.choice
+        
+        # Start division
+        rooms = [(1, 1, self.width-2, self.height-2)]
+        while rooms:
+            x, y, width, height = rooms.pop()
             if width < 3 or height < 3:
-                return
+                continue
             
             # Choose orientation (vertical or horizontal)
-            horizontal = height > width if random.random() > 0.5 else width > height
+            horizontal = height > width if rand() > 0.5 else width > height
             if width == height:
-                horizontal = random.choice([True, False])
+                horizontal = choice([True, False])
             
             # Wall position (must be even)
-            wx = x + (0 if horizontal else random.randrange(1, width-1) // 2 * 2)
-            wy = y + (random.randrange(1, height-1) // 2 * 2 if horizontal else 0)
+            wx = x + (0 if horizontal else randrange(1, width-1) // 2 * 2)
+            wy = y + (randrange(1, height-1) // 2 * 2 if horizontal else 0)
             
             # Passage position (must be odd)
-            px = wx + (0 if horizontal else random.randrange(0, 2) * 2 - 1)
-            py = wy + (random.randrange(0, 2) * 2 - 1 if horizontal else 0)
+            px = wx + (0 if horizontal else randrange(0, 2) * 2 - 1)
+            py = wy + (randrange(0, 2) * 2 - 1 if horizontal else 0)
             
-            # Draw wall
+            # Draw wall, leaving the passage open
             if horizontal:
-                for i in range(x, x + width):
-                    if i != px:
-                        maze[wy][i] = 1
+                maze[wy, x:x + width] = 1
+                maze[wy, px] = 0
             else:
-                for i in range(y, y + height):
-                    if i != py:
-                        maze[i][wx] = 1
+                maze[y:y + height, wx] = 1
+                maze[py, wx] = 0
             
-            # Recursively divide sub-rooms
+            # Push sub-rooms, second one first so the first is divided first
             if horizontal:
-                divide(x, y, width, wy - y)  # Top
-                divide(x, wy + 1, width, y + height - wy - 1)  # Bottom
+                rooms.append((x, wy + 1, width, y + height - wy - 1))  # Bottom
+                rooms.append((x, y, width, wy - y))  # Top
             else:
-                divide(x, y, wx - x, height)  # Left
-                divide(wx + 1, y, x + width - wx - 1, height)  # Right
-        
-        # Start division
-        divide(1, 1, self.width-2, self.height-2)
+                rooms.append((wx + 1, y, x + width - wx - 1, height))  # Right
+                rooms.append((x, y, wx - x, height))  # Left
         
         # FIXED: Create proper entrance and exit
         maze[1][0] = 0
@@ -186,10 +525,76 @@ class MazeGenerator:
         self.maze = maze
         return maze
     
+    def as_grid(self, packed=False):
+        """Wrap the last generated maze in a compact MazeGrid"""
+        return MazeGrid(self.maze, packed=packed)
+    
     def get_start_end(self):
         """Get start and end positions - FIXED to match maze layout"""
         # Start is just to the left of the entrance (which is at (0,1))
         start = (0, 1)
         # End is just to the right of the exit (which is at (width-1, height-2))
         end = (self.width-1, self.height-2)
-        return start, end
\ No newline at end of file
+        return start, end
+
+def spawn_seeds(count, base_seed=None):
+    """Independent, reproducible 64-bit seeds derived from one base seed"""
+    children = np.random.SeedSequence(base_seed).spawn(count)
+    return [int(child.generate_state(1, np.uint64)[0]) for child in children]
+
+
+def pool_map(function, jobs, processes=None, chunksize=None):
+    """Lazily map function over a list of jobs across a process pool
+
+    Results come back in job order. ``processes=1`` runs in the current
+    process without a pool; by default each worker gets about four chunks.
+    """
+    if processes == 1:
+        yield from map(function, jobs)
+        return
+    
+    from concurrent.futures import ProcessPoolExecutor
+    workers = processes or os.cpu_count() or 1
+    chunk = chunksize or max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(function, jobs, chunksize=chunk)
+
+
+def _generate_one(job):
+    """Process-pool worker: build one seeded maze"""
+    algorithm, width, height, seed = job
+    return MazeGenerator(width, height, seed=seed).generate(algorithm)
+
+
+def generate_many(algorithm, size, count=None, seeds=None, base_seed=None,
+                  processes=None, stack=False, chunksize=None):
+    """Generate many mazes in parallel across a process pool
+
+    ``size`` is an int or a ``(width, height)`` pair. Pass explicit ``seeds``,
+    or a ``count`` and optional ``base_seed`` to derive independent seeds
+    with ``spawn_seeds``. Each maze is built from its own seed, so results do
+    not depend on which worker runs them.
+
+    By default returns an iterator of ``(seed, maze)`` pairs in seed order,
+    streamed as workers finish. With ``stack=True`` returns ``(seeds, mazes)``
+    where ``mazes`` is one ``(count, height, width)`` uint8 array.
+    ``processes=1`` runs in the current process without a pool.
+    """
+    width, height = (size, size) if np.ndim(size) == 0 else size
+    width, height = int(width), int(height)
+    if seeds is None:
+        if count is None:
+            raise ValueError("Pass either count or seeds")
+        seeds = spawn_seeds(count, base_seed)
+    seeds = [int(seed) for seed in seeds]
+    jobs = [(algorithm, width, height, seed) for seed in seeds]
+    results = zip(seeds, pool_map(_generate_one, jobs, processes, chunksize))
+    
+    if not stack:
+        return results
+    
+    # MazeGenerator rounds even sizes up to odd
+    mazes = np.empty((len(seeds), height | 1, width | 1), dtype=np.uint8)
+    for i, (_, maze) in enumerate(results):
+        mazes[i] = maze
+    return np.array(seeds, dtype=np.uint64), mazes
@@ -0,0 +1,229 @@
+import heapq
+from array import array
+
+import numpy as np
+
+from maze_solver import MazeSolver
+
+
+class JunctionGraph:
+    """Maze collapsed to a weighted graph of junctions and dead ends.
+
+    Open cells with exactly two open neighbours are corridor cells. Each
+    corridor becomes one edge between the junctions or dead ends at its ends,
+    weighted by its length, and its cells are kept for expanding paths
+    again. Searches then only expand graph nodes, which on DFS-style mazes
+    are a small fraction of all open cells.
+    """
+
+    def __init__(self, maze):
+        solver = maze if isinstance(maze, MazeSolver) else MazeSolver(maze)
+        self.solver = solver
+
+        # Nodes are open cells whose degree is not 2
+        grid = np.frombuffer(bytes(solver.open), dtype=np.uint8).reshape(-1, solver.stride)
+        degree = np.zeros(grid.shape, dtype=np.uint8)
+        degree[1:-1, 1:-1] = (grid[1:-1, 2:] + grid[1:-1, :-2] +
+                              grid[2:, 1:-1] + grid[:-2, 1:-1])
+        nodes = np.flatnonzero((grid == 1) & (degree != 2)).tolist()
+
+        self.node_id = array('i', [-1]) * solver.size
+        self.node_index = []  # node id -> flat cell index
+        self.adjacency = []  # node id -> [(other node, edge id)]
+        for index in nodes:
+            self._add_node(index)
+
+        # Corridors: flat cell lists from edge_u towards edge_v
+        self.edge_u = []
+        self.edge_v = []
+        self.edge_cells = []
+        self.edge_of = array('i', [-1]) * solver.size
+        self.pos_of = array('i', [-1]) * solver.size
+        self._linked = set()  # Node pairs joined by a zero-length corridor
+
+        for index in nodes:
+            self._walk_corridors(self.node_id[index])
+
+        # Corridor loops that never reach another node are left unassigned;
+        # promote one of their cells to a node until none are left
+        unassigned = (grid.ravel() == 1) & (degree.ravel() == 2)
+        for index in np.flatnonzero(unassigned).tolist():
+            if self.edge_of[index] < 0 and self.node_id[index] < 0:
+                self._add_node(index)
+                self._walk_corridors(self.node_id[index])
+
+    def _add_node(self, index):
+        node = len(self.node_index)
+        self.node_id[index] = node
+        self.node_index.append(index)
+        self.adjacency.append([])
+        return node
+
+    def _walk_corridors(self, node):
+        """Follow every corridor leaving node and record it once"""
+        masks, moves, node_id = self.solver.masks, self.solver.moves, self.node_id
+        start = self.node_index[node]
+
+        for offset in moves[masks[start]]:
+            current = start + offset
+            previous = start
+            cells = array('i')
+            while node_id[current] < 0:
+                cells.append(current)
+                for step in moves[masks[current]]:
+                    following = current + step
+                    if following != previous:
+                        break
+                previous, current = current, following
+            other = node_id[current]
+
+            # Each corridor is seen from both ends; record it only once.
+            # Self-loops are skipped and their cells promoted later.
+            if other == node:
+                continue
+            if cells:
+                if self.edge_of[cells[0]] >= 0:
+                    continue
+            else:
+                pair = (min(node, other), max(node, other))
+                if pair in self._linked:
+                    continue
+                self._linked.add(pair)
+            edge = len(self.edge_u)
+            self.edge_u.append(node)
+            self.edge_v.append(other)
+            self.edge_cells.append(cells)
+            for pos, index in enumerate(cells):
+                self.edge_of[index] = edge
+                self.pos_of[index] = pos
+            self.adjacency[node].append((other, edge))
+            self.adjacency[other].append((node, edge))
+
+    @property
+    def node_count(self):
+        return len(self.node_index)
+
+    @property
+    def edge_count(self):
+        return len(self.edge_u)
+
+    def _anchors(self, index):
+        """Nodes reachable from a cell without passing another node, with costs"""
+        node = self.node_id[index]
+        if node >= 0:
+            return [(node, 0)]
+        edge, pos = self.edge_of[index], self.pos_of[index]
+        if edge < 0:
+            return []
+        length = len(self.edge_cells[edge])
+        return [(self.edge_u[edge], pos + 1), (self.edge_v[edge], length - pos)]
+
+    def _edge_path(self, edge, from_node):
+        """Corridor cells of edge in the direction leaving from_node"""
+        cells = self.edge_cells[edge]
+        return list(cells) if self.edge_u[edge] == from_node else list(reversed(cells))
+
+    def solve(self, start, end):
+        """Dijkstra over junctions; returns (cell path, expanded node cells)"""
+        solver = self.solver
+        src, dst = solver._index(start), solver._index(end)
+        if src < 0 or dst < 0 or not solver.open[src] or not solver.open[dst]:
+            return [], set()
+
+        if src == dst:
+            return [start], set()
+
+        end_costs = dict(self._anchors(dst))
+        goal = -1  # Virtual node for the end cell
+        dist = {}
+        prev = {}
+        heap = []
+
+        for node, cost in self._anchors(src):
+            if cost < dist.get(node, float('inf')):
+                dist[node] = cost
+                prev[node] = (None, None)
+                heapq.heappush(heap, (cost, node))
+
+        # Start and end on the same corridor: walk straight along it
+        edge = self.edge_of[src]
+        if edge >= 0 and edge == self.edge_of[dst]:
+            direct = abs(self.pos_of[src] - self.pos_of[dst])
+            dist[goal] = direct
+            prev[goal] = (None, None)
+            heapq.heappush(heap, (direct, goal))
+
+        expanded = []
+        done = set()
+        while heap:
+            d, node = heapq.heappop(heap)
+            if node in done:
+                continue
+            done.add(node)
+            if node == goal:
+                break
+            expanded.append(node)
+
+            if node in end_costs:
+                alt = d + end_costs[node]
+                if alt < dist.get(goal, float('inf')):
+                    dist[goal] = alt
+                    prev[goal] = (node, None)
+                    heapq.heappush(heap, (alt, goal))
+
+            for other, edge in self.adjacency[node]:
+                alt = d + len(self.edge_cells[edge]) + 1
+                if other not in done and alt < dist.get(other, float('inf')):
+                    dist[other] = alt
+                    prev[other] = (node, edge)
+                    heapq.heappush(heap, (alt, other))
+
+        visited = {solver._cell(self.node_index[node]) for node in expanded}
+        if goal not in done:
+            return [], visited
+        return [solver._cell(index) for index in self._expand(prev, src, dst)], visited
+
+    def _expand(self, prev, src, dst):
+        """Turn the node chain found by solve() back into flat cell indices"""
+        last, _ = prev[-1]
+        if last is None:
+            # Direct walk along a shared corridor
+            cells = self.edge_cells[self.edge_of[src]]
+            a, b = self.pos_of[src], self.pos_of[dst]
+            step = 1 if b >= a else -1
+            return [cells[pos] for pos in range(a, b + step, step)]
+
+        # Node chain from the first anchor to the last
+        chain = []
+        node = last
+        while node is not None:
+            parent, edge = prev[node]
+            chain.append((node, parent, edge))
+            node = parent
+        chain.reverse()
+
+        path = []
+        first = chain[0][0]
+        if self.node_index[first] != src:
+            # Start sits on a corridor: walk from it to the first node
+            edge, pos = self.edge_of[src], self.pos_of[src]
+            cells = self.edge_cells[edge]
+            if self.edge_u[edge] == first:
+                path.extend(cells[pos::-1])
+            else:
+                path.extend(cells[pos:])
+        path.append(self.node_index[first])
+
+        for node, parent, edge in chain[1:]:
+            path.extend(self._edge_path(edge, parent))
+            path.append(self.node_index[node])
+
+        if self.node_index[last] != dst:
+            # End sits on a corridor: walk from the last node to it
+            edge, pos = self.edge_of[dst], self.pos_of[dst]
+            cells = self.edge_cells[edge]
+            if self.edge_u[edge] == last:
+                path.extend(cells[:pos + 1])
+            else:
+                path.extend(cells[:pos - 1:-1] if pos > 0 else cells[::-1])
+        return path
@@ -0,0 +1,159 @@
+import numpy as np
+
+# Neighbor mask bits, one per (dx, dy) direction in DIRECTIONS order
+RIGHT, LEFT, DOWN, UP = 1, 2, 4, 8
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIRECTION_BITS = dict(zip(DIRECTIONS, (RIGHT, LEFT, DOWN, UP)))
+
+# Lookup tables indexed by a 4-bit mask: the open (dx, dy) moves
+MASK_MOVES = tuple(tuple(step for bit, step in enumerate(DIRECTIONS) if mask >> bit & 1)
+                   for mask in range(16))
+
+
+class MazeGrid:
+    """Compact maze storage shared by the generator, solver and renderers.
+
+    Cells use the same convention as the generators: 1 is a wall and 0 is a
+    path. The backing store is either one uint8 per cell (8x smaller than the
+    old int64 arrays) or, with ``packed=True``, one bit per cell packed along
+    each row (64x smaller). Packed grids answer cell and neighbour queries
+    from the bits and never keep an unpacked copy around.
+    """
+
+    def __init__(self, maze, packed=False):
+        cells = np.asarray(maze)
+        if cells.ndim != 2:
+            raise ValueError("maze must be a 2D array")
+        self.height, self.width = cells.shape
+        self.packed = packed
+        self._masks = None
+
+        walls = cells != 0
+        if packed:
+            self._bits = np.packbits(walls, axis=1)
+            self._cells = None
+        else:
+            self._bits = None
+            self._cells = frozen_array(walls.astype(np.uint8))
+
+    @classmethod
+    def from_array(cls, maze, packed=False):
+        """Build a grid from any 2D array (or return an existing grid)."""
+        if isinstance(maze, cls):
+            return maze
+        return cls(maze, packed=packed)
+
+    @property
+    def shape(self):
+        return self.height, self.width
+
+    @property
+    def nbytes(self):
+        """Size of the backing store in bytes."""
+        store = self._bits if self.packed else self._cells
+        return store.nbytes
+
+    def is_open(self, x, y):
+        """True if (x, y) is inside the maze and is a path cell."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        if self.packed:
+            return not (self._bits[y, x >> 3] >> (7 - (x & 7))) & 1
+        return not self._cells[y, x]
+
+    def is_wall(self, x, y):
+        return not self.is_open(x, y)
+
+    def neighbors(self, x, y):
+        """Open cells orthogonally adjacent to (x, y)."""
+        if self.packed or not (0 <= x < self.width and 0 <= y < self.height):
+            return [(x + dx, y + dy) for dx, dy in DIRECTIONS if self.is_open(x + dx, y + dy)]
+        return [(x + dx, y + dy) for dx, dy in MASK_MOVES[self.masks[y, x]]]
+
+    def mask(self, x, y):
+        """Neighbor mask of one cell (see neighbor_masks)."""
+        if not self.packed and 0 <= x < self.width and 0 <= y < self.height:
+            return int(self.masks[y, x])
+        mask = 0
+        for (dx, dy), bit in DIRECTION_BITS.items():
+            if self.is_open(x + dx, y + dy):
+                mask |= bit
+        return mask
+
+    @property
+    def masks(self):
+        """Read-only per-cell neighbor masks (see neighbor_masks).
+
+        Cached for unpacked grids only; a packed grid builds them on each
+        call, since a byte per cell would undo the packing.
+        """
+        if self.packed:
+            masks = neighbor_masks(self.array)
+            masks.flags.writeable = False
+            return masks
+        if self._masks is None:
+            self._masks = neighbor_masks(self.array)
+            self._masks.flags.writeable = False
+        return self._masks
+
+    @property
+    def array(self):
+        """Read-only uint8 array of the grid (1 = wall, 0 = path).
+
+        A view for unpacked grids. Packed grids unpack a fresh copy on each
+        call, so keep the result when reading many cells.
+        """
+        if self.packed:
+            view = np.unpackbits(self._bits, axis=1, count=self.width)
+        else:
+            view = self._cells.view()
+        view.flags.writeable = False
+        return view
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self.array
+        return self.array.astype(dtype)
+
+    def __getitem__(self, index):
+        # Lets existing code keep using maze[y][x] and maze[y, x]
+        if not self.packed:
+            return self.array[index]
+        # Unpack only the rows asked for
+        rows, cols = (index[0], index[1:]) if isinstance(index, tuple) else (index, ())
+        cells = np.unpackbits(self._bits[rows], axis=-1, count=self.width)
+        cells.flags.writeable = False
+        return cells[(Ellipsis,) + cols] if cols else cells
+
+    def __len__(self):
+        return self.height
+
+
+def maze_array(maze):
+    """Return a NumPy array for either a MazeGrid or a plain 2D array."""
+    if isinstance(maze, MazeGrid):
+        return maze.array
+    return np.asarray(maze)
+
+
+def frozen_array(maze):
+    """Read-only copy of an array whose data can never be written.
+
+    The copy lives in an immutable bytes buffer, so unlike an array with
+    ``writeable=False`` it cannot be made writeable again. SolveCache
+    relies on this to hash such arrays only once.
+    """
+    cells = np.ascontiguousarray(maze)
+    return np.frombuffer(cells.tobytes(), dtype=cells.dtype).reshape(cells.shape)
+
+
+def neighbor_masks(maze):
+    """uint8 array of 4-bit masks: which neighbours of each cell are open.
+
+    Bits are RIGHT, LEFT, DOWN (y + 1) and UP (y - 1); cells beyond the
+    border count as walls. ``MASK_MOVES[mask]`` gives the open (dx, dy)
+    moves, so move checks become one array read.
+    """
+    open_ = np.pad(maze_array(maze) == 0, 1).astype(np.uint8)
+    return (open_[1:-1, 2:] * RIGHT | open_[1:-1, :-2] * LEFT |
+            open_[2:, 1:-1] * DOWN | open_[:-2, 1:-1] * UP)
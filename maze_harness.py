@@ -0,0 +1,215 @@
+import argparse
+import random
+
+import numpy as np
+
+from maze_generator import pool_map, spawn_seeds
+from maze_grid import DIRECTION_BITS
+from maze_sim import MobileMazeGame
+
+
+class HintBot:
+    """Walks the shortest path to the exit, like a player following the hint.
+
+    After each step the bot waits ``reaction_ticks`` ticks before moving
+    again. With ``mistake_rate`` > 0 some moves go in a random open
+    direction instead.
+    """
+
+    def __init__(self, reaction_ticks=6, mistake_rate=0.0):
+        self.reaction_ticks = reaction_ticks
+        self.mistake_rate = mistake_rate
+        self.random = random.Random()
+        self.wait = reaction_ticks
+
+    def reset(self, rng):
+        self.random = rng
+        self.wait = self.reaction_ticks
+
+    def choose(self, game):
+        """Direction to move this tick, or None to stay put"""
+        if self.wait > 0:
+            self.wait -= 1
+            return None
+        self.wait = self.reaction_ticks
+
+        cell = (int(round(game.player.x)), int(round(game.player.y)))
+        if self.mistake_rate and self.random.random() < self.mistake_rate:
+            return random_direction(game, cell, self.random)
+        step = game.distance_field.next_step(cell)
+        if step is None:
+            return None
+        return direction_to(game, cell, step)
+
+
+class RandomBot(HintBot):
+    """Moves in a random open direction every time it reacts."""
+
+    def __init__(self, reaction_ticks=6):
+        super().__init__(reaction_ticks, mistake_rate=1.0)
+
+
+class ScriptedBot:
+    """Plays a fixed list of directions, one per ``reaction_ticks``."""
+
+    def __init__(self, directions, reaction_ticks=6):
+        self.directions = list(directions)
+        self.reaction_ticks = reaction_ticks
+        self.position = 0
+        self.wait = reaction_ticks
+
+    def reset(self, rng):
+        self.position = 0
+        self.wait = self.reaction_ticks
+
+    def choose(self, game):
+        if self.position >= len(self.directions):
+            return None
+        if self.wait > 0:
+            self.wait -= 1
+            return None
+        self.wait = self.reaction_ticks
+        self.position += 1
+        return self.directions[self.position - 1]
+
+
+def direction_to(game, cell, step):
+    """Name of the direction from cell to the neighbouring cell step"""
+    delta = (step[0] - cell[0], step[1] - cell[1])
+    for direction, move in game.direction_steps.items():
+        if move == delta:
+            return direction
+    return None
+
+
+def random_direction(game, cell, rng):
+    x, y = cell
+    open_moves = [direction for direction, move in game.direction_steps.items()
+                  if game.masks[y, x] & DIRECTION_BITS[move]]
+    return rng.choice(open_moves) if open_moves else None
+
+
+def play_game(level, seed, bot, max_ticks=60 * 300, level_config=None):
+    """Play one level headless at full speed and return the outcome
+
+    ``level_config`` overrides entries of the level's config, e.g.
+    ``{"snake_speed": 12.0}``. The result's ``outcome`` is "won", "caught"
+    or "timeout"; ``seconds`` is simulated time since the first move.
+    """
+    game = MobileMazeGame(rng=random.Random(seed))
+    game.prefetch_enabled = False
+    if level_config:
+        game.level_configs[level] = {**game.level_configs[level], **level_config}
+    game.start_level(level)
+    bot.reset(random.Random(seed + 1))
+
+    ticks = 0
+    while ticks < max_ticks:
+        if not game.player.moving:
+            direction = bot.choose(game)
+            if direction is not None:
+                game.move_player(direction)
+        ticks += 1
+        if game.step():
+            break
+
+    outcome = {"level_complete": "won", "game_over": "caught"}.get(game.game_state, "timeout")
+    seconds = (game.clock.now_ms() - game.start_time) / 1000 if game.game_started else 0.0
+    return {"level": level, "seed": seed, "outcome": outcome, "ticks": ticks,
+            "seconds": seconds, "moves": game.player.moves_count}
+
+
+def _play_one(job):
+    """Process-pool worker: play one game"""
+    level, seed, bot, max_ticks, level_config = job
+    return play_game(level, seed, bot, max_ticks, level_config)
+
+
+def run_games(levels, games=100, bot=None, base_seed=None, processes=None,
+              max_ticks=60 * 300, level_configs=None, chunksize=None):
+    """Play ``games`` games of every level across a process pool
+
+    Seeds are derived with ``spawn_seeds``, so a run is reproducible from
+    ``base_seed``. ``level_configs`` maps level -> config overrides.
+    ``processes=1`` runs in the current process without a pool. Returns the
+    list of per-game results from ``play_game``.
+    """
+    bot = bot or HintBot()
+    level_configs = level_configs or {}
+    levels = list(levels)
+    seeds = spawn_seeds(len(levels) * games, base_seed)
+    jobs = [(level, seeds[i * games + game], bot, max_ticks, level_configs.get(level))
+            for i, level in enumerate(levels) for game in range(games)]
+    return list(pool_map(_play_one, jobs, processes, chunksize))
+
+
+def _distribution(values):
+    if not values:
+        return None
+    values = np.asarray(values, dtype=float)
+    p10, p50, p90 = np.percentile(values, [10, 50, 90])
+    return {"mean": float(values.mean()), "p10": float(p10), "p50": float(p50),
+            "p90": float(p90), "max": float(values.max())}
+
+
+def summarize(results):
+    """Per-level win rate and time-to-exit / catch-time distributions"""
+    by_level = {}
+    for result in results:
+        by_level.setdefault(result["level"], []).append(result)
+
+    report = {}
+    for level, games in sorted(by_level.items()):
+        won = [game["seconds"] for game in games if game["outcome"] == "won"]
+        caught = [game["seconds"] for game in games if game["outcome"] == "caught"]
+        report[level] = {
+            "games": len(games),
+            "win_rate": len(won) / len(games),
+            "caught_rate": len(caught) / len(games),
+            "timeout_rate": (len(games) - len(won) - len(caught)) / len(games),
+            "exit_seconds": _distribution(won),
+            "catch_seconds": _distribution(caught),
+        }
+    return report
+
+
+def format_report(report):
+    def cell(stats):
+        if stats is None:
+            return "-"
+        return f"{stats['p50']:.1f}s (p10 {stats['p10']:.1f}, p90 {stats['p90']:.1f})"
+
+    lines = [f"{'level':>5} {'games':>6} {'win':>6} {'caught':>7}  {'time to exit':<30} catch time"]
+    for level, row in report.items():
+        lines.append(f"{level:>5} {row['games']:>6} {row['win_rate']:>6.0%} {row['caught_rate']:>7.0%}"
+                     f"  {cell(row['exit_seconds']):<30} {cell(row['catch_seconds'])}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play MobileMazeGame levels headless with bots")
+    parser.add_argument("--levels", default="1-10", help="e.g. 1-10 or 2,5,7")
+    parser.add_argument("--games", type=int, default=100, help="games per level")
+    parser.add_argument("--bot", choices=["hint", "random"], default="hint")
+    parser.add_argument("--reaction", type=int, default=6, help="bot reaction delay in ticks")
+    parser.add_argument("--mistakes", type=float, default=0.0, help="hint bot random-move rate")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if "-" in args.levels:
+        first, last = map(int, args.levels.split("-"))
+        levels = range(first, last + 1)
+    else:
+        levels = [int(level) for level in args.levels.split(",")]
+
+    if args.bot == "random":
+        bot = RandomBot(args.reaction)
+    else:
+        bot = HintBot(args.reaction, args.mistakes)
+    results = run_games(levels, args.games, bot, base_seed=args.seed, processes=args.processes)
+    print(format_report(summarize(results)))
+
+
+if __name__ == "__main__":
+    main()
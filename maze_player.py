@@ -1,9 +1,15 @@
 import pygame
 import math
-import time
+from maze_sim import WallClock
+
+def pygame_clock():
+    """WallClock on pygame's tick counter, shared by the pygame front end"""
+    return WallClock(lambda: pygame.time.get_ticks() / 1000)
 
 class Player:
-    def __init__(self, start_x, start_y, color=(65, 105, 225)):
+    def __init__(self, start_x, start_y, color=(65, 105, 225), clock=None):
+        # All timing goes through the clock; inject a TickClock to run headless
+        self.clock = clock or pygame_clock()
         self.start_x = start_x
         self.start_y = start_y
         self.x = float(start_x)
@@ -38,14 +44,14 @@ class Player:
         """Starts a movement animation to a new grid cell."""
         self.target_x = float(new_target_x)
         self.target_y = float(new_target_y)
-        self.move_start_time = time.time()
+        self.move_start_time = self.clock.now()
         self.moving = True
         self.moves_count += 1
 
     def update(self, snake_distance):
         """Updates the player's position during movement."""
         if self.moving:
-            elapsed = time.time() - self.move_start_time
+            elapsed = self.clock.now() - self.move_start_time
             progress = min(1.0, elapsed / self.move_duration)
             
             # Interpolate position
@@ -64,7 +70,7 @@ class Player:
         if self.level_start_time == 0:
             return 0
         
-        current_time_ms = pygame.time.get_ticks()
+        current_time_ms = self.clock.now_ms()
         start_time_ms = self.level_start_time
         
         if self.level_complete_time > 0:
@@ -0,0 +1,504 @@
+import random
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+from maze_generator import MazeGenerator
+from maze_solver import MazeSolver
+from maze_grid import maze_array, DIRECTION_BITS
+from maze_cache import MazeCache
+from maze_enemies import EnemySwarm
+
+
+class WallClock:
+    """Real time in seconds from ``source``, for interactive front ends.
+
+    Real time moves by itself, so ``advance`` is a no-op; ``tick_rate`` is
+    the simulation rate a game driven by this clock steps at.
+    """
+
+    def __init__(self, source=time.perf_counter, tick_rate=60):
+        self.source = source
+        self.tick_rate = tick_rate
+
+    def advance(self, ticks=1):
+        pass
+
+    def now(self):
+        return self.source()
+
+    def now_ms(self):
+        return self.source() * 1000
+
+
+class TickClock:
+    """Simulated time that moves only when advanced by whole ticks.
+
+    Game logic that reads time from a TickClock is deterministic and can run
+    headless as fast as the CPU allows.
+    """
+
+    def __init__(self, tick_rate=60):
+        self.tick_rate = tick_rate
+        self.ticks = 0
+
+    @property
+    def dt(self):
+        return 1.0 / self.tick_rate
+
+    def advance(self, ticks=1):
+        self.ticks += ticks
+
+    def now(self):
+        return self.ticks / self.tick_rate
+
+    def now_ms(self):
+        return self.ticks * 1000 / self.tick_rate
+
+
+class FixedTimestep:
+    """Accumulates real frame times and hands them out as whole fixed ticks.
+
+    ``alpha`` is the fraction of a tick left over, for interpolating the
+    rendered positions between the last two simulated states.
+    """
+
+    def __init__(self, tick_rate=60, max_ticks=10):
+        self.step = 1.0 / tick_rate
+        self.max_ticks = max_ticks  # Drop time rather than spiral after a stall
+        self.accumulator = 0.0
+
+    def ticks_for(self, dt):
+        self.accumulator += dt
+        ticks = int(self.accumulator / self.step + 1e-9)
+        self.accumulator = max(0.0, self.accumulator - ticks * self.step)
+        if ticks > self.max_ticks:
+            ticks = self.max_ticks
+            self.accumulator = 0.0
+        return ticks
+
+    @property
+    def alpha(self):
+        return min(1.0, self.accumulator / self.step)
+
+
+class MobilePlayer:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.prev_x = x  # Position before the last tick, for interpolation
+        self.prev_y = y
+        self.target_x = x
+        self.target_y = y
+        self.from_x = x  # Cell the current move started from
+        self.from_y = y
+        self.moving = False
+        self.move_progress = 0
+        self.move_speed = 18.0  # Cells per second
+        self.moves_count = 0
+        self.level_start_time = 0
+        self.level_complete_time = 0
+        
+    def set_target(self, target_x, target_y):
+        self.from_x, self.from_y = self.x, self.y
+        self.target_x = target_x
+        self.target_y = target_y
+        self.moving = True
+        self.move_progress = 0
+        self.moves_count += 1
+    
+    def update(self, dt):
+        """Advance dt seconds along the current move"""
+        self.prev_x, self.prev_y = self.x, self.y
+        if self.moving:
+            self.move_progress += self.move_speed * dt
+            if self.move_progress >= 1:
+                self.x = self.target_x
+                self.y = self.target_y
+                self.moving = False
+            else:
+                self.x = self.from_x + (self.target_x - self.from_x) * self.move_progress
+                self.y = self.from_y + (self.target_y - self.from_y) * self.move_progress
+    
+    def reset(self, x, y):
+        self.x = x
+        self.y = y
+        self.prev_x = x
+        self.prev_y = y
+        self.from_x = x
+        self.from_y = y
+        self.target_x = x
+        self.target_y = y
+        self.moving = False
+        self.move_progress = 0
+        self.moves_count = 0
+    
+    def render_position(self, alpha):
+        """Position blended between the last two ticks"""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+
+class MobileSnake:
+    def __init__(self, x, y, maze, start_delay=10000, solver=None):
+        self.x = x
+        self.y = y
+        self.prev_x = x  # Position before the last tick, for interpolation
+        self.prev_y = y
+        self.from_x = x  # Cell the current move started from
+        self.from_y = y
+        self.target_x = x
+        self.target_y = y
+        self.moving = False
+        self.move_progress = 0
+        self.move_speed = 4.8  # Cells per second
+        self.maze = maze_array(maze)
+        self.solver = solver or MazeSolver(self.maze)
+        self.masks = self.solver.cell_masks
+        self.path = deque()
+        self.path_start = (x, y)  # Cell the path is walked from
+        self.retarget_timer = 0.0
+        self.update_frequency = 6  # Retarget every update_frequency / 60 seconds
+        self.active = False
+        self.activation_time = 0
+        self.start_delay = start_delay
+        
+    def _retarget(self, goal):
+        """Point the path at goal, reusing the existing path where possible"""
+        last = self.path[-1] if self.path else self.path_start
+        if goal == last:
+            return  # Endpoints unchanged: nothing to do
+        
+        # On loop-free mazes the new path is the old one plus the player's
+        # few steps, with any backtracking cancelled, so a player move costs
+        # a tiny local search instead of a BFS over the whole maze
+        if self.solver.is_perfect:
+            steps = self.solver.solve_local(last, goal)
+            for cell in steps[1:]:
+                before = self.path[-2] if len(self.path) >= 2 else self.path_start
+                if self.path and cell == before:
+                    self.path.pop()
+                else:
+                    self.path.append(cell)
+            if steps:
+                return
+        
+        if self.solver.is_perfect:
+            path, _ = self.solver.solve_tree(self.path_start, goal)
+        else:
+            # Path only: no visited set is kept for the snake
+            path = map(tuple, self.solver.solve_path(self.path_start, goal).tolist())
+        self.path = deque(path)
+        if self.path:
+            self.path.popleft()
+    
+    def update_path(self, player_x, player_y, dt):
+        if not self.active:
+            return
+            
+        self.retarget_timer += dt
+        if self.retarget_timer * 60 >= self.update_frequency - 1e-9:
+            self.retarget_timer = 0.0
+            self._retarget((int(player_x), int(player_y)))
+    
+    def update(self, player_x, player_y, current_time, dt):
+        """Advance dt seconds; current_time (ms) drives activation"""
+        self.prev_x, self.prev_y = self.x, self.y
+        if not self.active and current_time >= self.activation_time:
+            self.active = True
+        
+        if self.active:
+            self.update_path(player_x, player_y, dt)
+            
+            if not self.moving and self.path:
+                next_x, next_y = self.path[0]
+                x, y = self.path_start
+                
+                # The next cell must be an open neighbour of the current one
+                if self.masks[y, x] & DIRECTION_BITS.get((next_x - x, next_y - y), 0):
+                    
+                    self.from_x, self.from_y = x, y
+                    self.target_x = next_x
+                    self.target_y = next_y
+                    self.moving = True
+                    self.move_progress = 0
+                    self.path_start = self.path.popleft()
+            
+            if self.moving:
+                self.move_progress += self.move_speed * dt
+                if self.move_progress >= 1:
+                    self.x = self.target_x
+                    self.y = self.target_y
+                    self.moving = False
+                else:
+                    self.x = self.from_x + (self.target_x - self.from_x) * self.move_progress
+                    self.y = self.from_y + (self.target_y - self.from_y) * self.move_progress
+    
+    def reset(self, x, y, start_delay=10000):
+        self.x = x
+        self.y = y
+        self.prev_x = x
+        self.prev_y = y
+        self.from_x = x
+        self.from_y = y
+        self.target_x = x
+        self.target_y = y
+        self.moving = False
+        self.move_progress = 0
+        self.path = deque()
+        self.path_start = (x, y)
+        self.retarget_timer = 0.0
+        self.active = False
+        self.start_delay = start_delay
+        self.activation_time = 0
+    
+    def check_collision(self, player_x, player_y):
+        if not self.active:
+            return False
+        return (abs(self.x - player_x) < 0.5 and abs(self.y - player_y) < 0.5)
+    
+    def render_position(self, alpha):
+        """Position blended between the last two ticks"""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+    
+    def get_activation_countdown(self, current_time):
+        if self.active:
+            return 0
+        time_left = max(0, self.activation_time - current_time)
+        return time_left // 1000
+
+class MobileMazeGame:
+    """Kivy-free game logic, advanced in fixed ticks.
+
+    All time comes from ``clock`` (a TickClock by default, advanced once per
+    ``step``) and all randomness from ``rng``, so a game is reproducible and
+    can be fast-forwarded headless. Ticks run at the clock's ``tick_rate``
+    and speeds are in cells per second, so the rate changes only the
+    precision, not the game speed. Front ends call ``update(dt)`` with real
+    frame times and draw positions interpolated by ``alpha``.
+    """
+    
+    def __init__(self, clock=None, rng=None, tick_rate=60):
+        self.clock = clock or TickClock(tick_rate)
+        self.tick_rate = self.clock.tick_rate
+        self.ticks = 0
+        self.random = rng or random.Random()
+        self.timestep = FixedTimestep(self.tick_rate)
+        self.maze = None
+        self.masks = None  # Neighbour masks of the current maze
+        self.player = None
+        self.snake = None
+        self.enemies = None  # Optional EnemySwarm, from a level's "enemies" count
+        self.game_state = "menu"
+        self.current_level = 1
+        self.max_level = 10
+        self.show_hint = False
+        self.hint_path = None
+        self.distance_field = None
+        self.game_started = False
+        self.start_time = 0
+        self.level_seeds = {}
+        self.maze_cache = MazeCache()
+        self.direction_steps = {"up": (0, 1), "down": (0, -1), "left": (-1, 0), "right": (1, 0)}
+        
+        # Background preparation of the next level
+        self.prefetch_enabled = True
+        self._prefetched = {}
+        self._prefetch_executor = None
+        
+        # snake_speed is in cells per second, snake_freq in 1/60 s units
+        self.level_configs = {
+            1: {"size": 11, "algorithm": "dfs", "snake_speed": 4.8, "snake_freq": 6, "snake_delay": 10000},
+            2: {"size": 11, "algorithm": "dfs", "snake_speed": 6.0, "snake_freq": 5, "snake_delay": 9000},
+            3: {"size": 15, "algorithm": "dfs", "snake_speed": 7.2, "snake_freq": 5, "snake_delay": 8000},
+            4: {"size": 15, "algorithm": "prims", "snake_speed": 8.4, "snake_freq": 4, "snake_delay": 7000},
+            5: {"size": 19, "algorithm": "prims", "snake_speed": 9.6, "snake_freq": 4, "snake_delay": 6000},
+            6: {"size": 19, "algorithm": "prims", "snake_speed": 10.8, "snake_freq": 3, "snake_delay": 5000},
+            7: {"size": 21, "algorithm": "division", "snake_speed": 12.0, "snake_freq": 3, "snake_delay": 4000},
+            8: {"size": 23, "algorithm": "division", "snake_speed": 13.2, "snake_freq": 2, "snake_delay": 3000},
+            9: {"size": 25, "algorithm": "division", "snake_speed": 14.4, "snake_freq": 2, "snake_delay": 2000},
+            10: {"size": 27, "algorithm": "division", "snake_speed": 15.6, "snake_freq": 1, "snake_delay": 1000}
+        }
+    
+    def _level_seed(self, level):
+        # Each level keeps its seed, so restarts and revisits hit the cache
+        if level not in self.level_seeds:
+            self.level_seeds[level] = self.random.randrange(2**32)
+        return self.level_seeds[level]
+    
+    def _build_level(self, level, seed):
+        """Build the maze, solver and hint for a level (safe off the UI thread)"""
+        config = self.level_configs[level]
+        size = config["size"]
+        
+        generator = MazeGenerator(size, size, seed=seed)
+        maze = self.maze_cache.get_or_generate(generator, config["algorithm"])
+        solver = MazeSolver(maze)
+        start_pos, end_pos = generator.get_start_end()
+        
+        # Perfect mazes get an LCA index so the snake can look paths up
+        if solver.is_perfect:
+            solver.tree_index
+        
+        # Distance-to-exit field: hints from any cell without a new search
+        distance_field = solver.distance_field(end_pos)
+        hint_path = distance_field.path_from(start_pos)
+        
+        return {"maze": maze, "solver": solver, "start": start_pos, "end": end_pos,
+                "distance_field": distance_field, "hint_path": hint_path}
+    
+    def prefetch_level(self, level):
+        """Start building a level in a worker thread"""
+        if not self.prefetch_enabled or level not in self.level_configs:
+            return
+        if level in self._prefetched:
+            return
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        self._prefetched[level] = self._prefetch_executor.submit(
+            self._build_level, level, self._level_seed(level))
+    
+    def _take_level(self, level):
+        """Use the prefetched level, waiting for it if it is still being built
+
+        Only builds synchronously if the level was never prefetched or its
+        prefetch failed; a second build would just compete with the worker.
+        """
+        future = self._prefetched.get(level)
+        if future is None or future.exception() is not None:  # exception() waits
+            future = Future()
+            future.set_result(self._build_level(level, self._level_seed(level)))
+        
+        # Keep the current level around for restarts
+        self._prefetched = {level: future}
+        return future.result()
+    
+    def start_level(self, level):
+        self.current_level = level
+        config = self.level_configs[level]
+        
+        level_data = self._take_level(level)
+        self.maze = level_data["maze"]
+        self.masks = level_data["solver"].cell_masks
+        start_pos = level_data["start"]
+        
+        # Initialize player
+        if not self.player:
+            self.player = MobilePlayer(start_pos[0], start_pos[1])
+        else:
+            self.player.reset(start_pos[0], start_pos[1])
+        
+        # Initialize snake
+        self.snake = MobileSnake(start_pos[0], start_pos[1], self.maze, config["snake_delay"],
+                                 solver=level_data["solver"])
+        self.snake.move_speed = config["snake_speed"]
+        self.snake.update_frequency = config["snake_freq"]
+        
+        # Extra enemies, spawned away from the start, chasing along one
+        # flow field that is rebuilt only when the player changes cell
+        self.enemies = None
+        if config.get("enemies"):
+            self.enemies = EnemySwarm.spawn(self.maze, config["enemies"], avoid=start_pos,
+                                            min_distance=config["size"] // 2, masks=self.masks,
+                                            start_delay=config["snake_delay"],
+                                            move_speed=config["snake_speed"],
+                                            bias_factor=config.get("enemy_bias", 1.0),
+                                            flow=level_data["solver"].flow_field(start_pos),
+                                            rng=np.random.default_rng(self.random.randrange(2**32)))
+        
+        self.distance_field = level_data["distance_field"]
+        self.hint_path = level_data["hint_path"]
+        
+        self.game_started = False
+        self.game_state = "playing"
+        self.start_time = 0
+        
+        # Build the next level while this one is played
+        self.prefetch_level(level + 1)
+    
+    def move_player(self, direction):
+        if not self.player or self.player.moving or self.game_state != "playing":
+            return
+        
+        x, y = int(round(self.player.x)), int(round(self.player.y))
+        dx, dy = self.direction_steps.get(direction, (0, 0))
+        new_x, new_y = x + dx, y + dy
+        
+        # Check if move is valid
+        if self.masks[y, x] & DIRECTION_BITS.get((dx, dy), 0):
+            
+            # Start game on first move
+            if not self.game_started:
+                self.game_started = True
+                self.start_time = self.clock.now_ms()
+                self.snake.activation_time = self.start_time + self.snake.start_delay
+                if self.enemies:
+                    self.enemies.start(self.start_time)
+            
+            self.player.set_target(new_x, new_y)
+            
+            # Keep the hint pointing at the exit from where the player is going
+            self.hint_path = self.distance_field.path_from((new_x, new_y))
+            return True
+        return False
+    
+    @property
+    def alpha(self):
+        """Fraction of a tick since the last step, for interpolated drawing"""
+        return self.timestep.alpha
+    
+    def update(self, dt):
+        """Run as many fixed ticks as dt seconds of real time cover"""
+        for _ in range(self.timestep.ticks_for(dt)):
+            if self.step():
+                return True
+        return False
+    
+    def step(self):
+        """Advance the simulation by exactly one tick"""
+        self.ticks += 1
+        self.clock.advance()
+        if self.game_state == "playing" and self.game_started:
+            current_time = self.clock.now_ms()
+            dt = 1.0 / self.tick_rate
+            
+            # Update player
+            self.player.update(dt)
+            
+            # Update snake
+            if self.snake:
+                self.snake.update(self.player.x, self.player.y, current_time, dt)
+            if self.enemies:
+                self.enemies.update(self.player.x, self.player.y, current_time, dt)
+            
+            # Check win condition
+            end_pos = (self.maze.shape[1]-1, self.maze.shape[0]-2)
+            player_pos = (int(round(self.player.x)), int(round(self.player.y)))
+            if player_pos == end_pos and not self.player.moving:
+                self.game_state = "level_complete"
+                return True
+            
+            # Check game over
+            if self.snake and self.snake.check_collision(self.player.x, self.player.y):
+                self.game_state = "game_over"
+                return True
+            if self.enemies and self.enemies.check_collision(self.player.x, self.player.y):
+                self.game_state = "game_over"
+                return True
+        
+        return False
+    
+    def get_distance_to_exit(self):
+        """Steps from the player's cell to the exit (O(1) lookup)"""
+        if not self.player or not self.distance_field:
+            return -1
+        return self.distance_field.distance((int(round(self.player.x)), int(round(self.player.y))))
+    
+    def get_level_time(self):
+        if not self.game_started:
+            return 0
+        current_time = self.clock.now_ms()
+        return max(0, (current_time - self.start_time) // 1000)
+
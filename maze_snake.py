@@ -1,33 +1,43 @@
-import pygame
 import math
-import time
 from collections import deque
 import numpy as np
 import random 
+from maze_grid import maze_array, neighbor_masks, DIRECTION_BITS, MASK_MOVES
+from maze_player import pygame_clock
 
 class Snake:
-    def __init__(self, start_x, start_y, maze, start_delay=10000, color=(50, 205, 50)):
+    def __init__(self, start_x, start_y, maze, start_delay=10000, color=(50, 205, 50),
+                 clock=None, rng=None):
+        # All timing and randomness go through these, so a TickClock and a
+        # seeded random.Random make the snake deterministic
+        self.clock = clock or pygame_clock()
+        self.random = rng or random
         self.start_x = start_x
         self.start_y = start_y
         self.x = float(start_x)
         self.y = float(start_y)
         self.color = color 
-        self.maze = maze
-        self.height, self.width = maze.shape
+        self.maze = maze_array(maze)
+        self.height, self.width = self.maze.shape
+        self.masks = neighbor_masks(self.maze)
 
         # Movement control
         self.update_frequency = 12 
-        self.last_update_time = time.time()
+        self.last_update_time = self.clock.now()
         self.update_interval = self.update_frequency / 60.0 
         
         # NEW: Smartness factor (0.0 = pure random, 1.0 = pure shortest path, 
         # typically kept low, e.g., 0.1 - 0.5)
         self.bias_factor = 0.0
 
+        # Optional FlowField shared by all chasers; when set, the closer move
+        # is its next step through the maze rather than by Manhattan distance
+        self.flow_field = None
+
         # State
         self.is_active = False
         self.start_delay = start_delay # Time in milliseconds before the snake starts moving
-        self.activation_time = pygame.time.get_ticks() + start_delay 
+        self.activation_time = self.clock.now_ms() + start_delay 
         self.moving = False
         
         # Animation targets
@@ -38,7 +48,7 @@ class Snake:
 
     def _animate_move(self):
         """Updates the snake's position during smooth movement."""
-        elapsed = time.time() - self.move_start_time
+        elapsed = self.clock.now() - self.move_start_time
         progress = min(1.0, elapsed / self.move_duration)
         
         # Interpolate position
@@ -57,15 +67,9 @@ class Snake:
 
     def _get_valid_moves(self, curr_x, curr_y):
         """Finds all valid adjacent path cells the snake can move to."""
-        valid_moves = []
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            next_x, next_y = curr_x + dx, curr_y + dy
-            
-            # Check bounds and if it's a path (0)
-            if (0 <= next_x < self.width and 0 <= next_y < self.height and 
-                self.maze[next_y][next_x] == 0):
-                valid_moves.append((next_x, next_y))
-        return valid_moves
+        if not (0 <= curr_x < self.width and 0 <= curr_y < self.height):
+            return []
+        return [(curr_x + dx, curr_y + dy) for dx, dy in MASK_MOVES[self.masks[curr_y, curr_x]]]
     
     
     def _calculate_distance(self, x1, y1, x2, y2):
@@ -83,21 +87,35 @@ class Snake:
         if not valid_moves:
             return None, None
 
-        current_dist = self._calculate_distance(curr_x, curr_y, player_x, player_y)
+        if self.flow_field is not None:
+            self.flow_field.update((player_x, player_y))  # No-op unless the player changed cell
+            best = int(self.flow_field.directions[curr_y, curr_x])
+
+            # -1 for the flow field's step, +1 for the rest; all 0 with no step
+            def change(x, y):
+                if not best:
+                    return 0
+                return -1 if DIRECTION_BITS[(x - curr_x, y - curr_y)] == best else 1
+        else:
+            current_dist = self._calculate_distance(curr_x, curr_y, player_x, player_y)
+
+            def change(x, y):
+                new_dist = self._calculate_distance(x, y, player_x, player_y)
+                return (new_dist > current_dist) - (new_dist < current_dist)
         
         # Assign weights based on distance change
         moves_with_weights = []
         base_weight = 1.0 
 
         for move_x, move_y in valid_moves:
-            new_dist = self._calculate_distance(move_x, move_y, player_x, player_y)
+            step = change(move_x, move_y)
             
             weight = base_weight
             
-            if new_dist < current_dist:
+            if step < 0:
                 # Move brings the snake CLOSER to the player (Good move)
                 weight += self.bias_factor
-            elif new_dist > current_dist:
+            elif step > 0:
                 # Move takes the snake FARTHER from the player (Bad move)
                 weight -= (self.bias_factor / 2) # Reduce weight slightly
             # If distance is the same, weight remains base_weight
@@ -112,7 +130,7 @@ class Snake:
         weights = [weight for move, weight in moves_with_weights]
         
         # Select one move based on the calculated weights
-        chosen_move = random.choices(moves, weights=weights, k=1)[0]
+        chosen_move = self.random.choices(moves, weights=weights, k=1)[0]
         return chosen_move
 
 
@@ -121,7 +139,7 @@ class Snake:
         
         if not self.is_active:
             # Check if delay period is over 
-            if pygame.time.get_ticks() >= self.activation_time:
+            if self.clock.now_ms() >= self.activation_time:
                 self.is_active = True
             else:
                 return # Snake is not yet active
@@ -132,7 +150,7 @@ class Snake:
             return
         
         # --- Biased Wandering Movement Logic ---
-        current_time = time.time()
+        current_time = self.clock.now()
         
         # Check if it's time for the snake to make a new grid move
         if current_time - self.last_update_time >= self.update_interval:
@@ -1,176 +1,901 @@
 import heapq
-from collections import deque
+import math
+from array import array
+from contextlib import contextmanager
 import numpy as np
 import random
+from maze_grid import maze_array, neighbor_masks, DIRECTIONS, RIGHT, LEFT, DOWN, UP
+
+class _Scratch:
+    """Full-size search tables lent to one search at a time.
+
+    The engine lists every index it writes in ``touched`` and ``reset``
+    restores just those cells, or refills whole tables after a search that
+    covered much of the maze. Tables are allocated on first use.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.touched = []
+        self._tables = {}  # name -> (table, NumPy view, empty value)
+
+    def table(self, name):
+        """int32 table by name (empty = -1); "closed" is a bytearray, "cost" doubles"""
+        entry = self._tables.get(name)
+        if entry is None:
+            if name == "closed":
+                table, empty = bytearray(self.size), 0
+            elif name == "cost":
+                table, empty = array('d', [math.inf]) * self.size, math.inf
+            else:
+                table, empty = array('i', [-1]) * self.size, -1
+            entry = self._tables[name] = (table, np.asarray(memoryview(table)), empty)
+        return entry[0]
+
+    def reset(self):
+        touched, self.touched = self.touched, []
+        if not touched:
+            return
+        if len(touched) > self.size // 16:
+            index = slice(None)
+        else:
+            index = np.array(touched, dtype=np.intp)
+        for _, view, empty in self._tables.values():
+            view[index] = empty
+
 
 class MazeSolver:
+    """Path finding on a maze grid.
+
+    All searches run on flat cell indices over a copy of the maze padded
+    with one ring of walls, so neighbours are ``index + offset`` with no
+    bounds checks. Predecessor and distance tables are preallocated int32
+    arrays instead of dicts keyed by ``(x, y)`` tuples; coordinates are only
+    built when a result is returned. The tables belong to the solver and are
+    reused, each search resetting only the cells it touched, so a short
+    search on a large maze does not pay for the whole grid.
+    """
+
     def __init__(self, maze):
-        self.maze = maze
-        self.height, self.width = maze.shape
-    
-    def solve_bfs(self, start, end):
-        """Breadth-First Search - guarantees shortest path"""
-        queue = deque([start])
-        visited = {start: None}
-        
-        while queue:
-            current = queue.popleft()
-            
-            if current == end:
+        # Accepts a MazeGrid or a plain 2D array
+        self.maze = maze_array(maze)
+        self.height, self.width = self.maze.shape
+
+        # Padded flat grid: 1 = open, 0 = wall (including the padding ring)
+        self.stride = self.width + 2
+        padded = np.zeros((self.height + 2, self.stride), dtype=np.uint8)
+        padded[1:-1, 1:-1] = self.maze == 0
+        self.open = bytearray(padded.tobytes())
+        self.size = len(self.open)
+
+        # Same order as the (dx, dy) lists: right, left, down, up
+        self.offsets = (1, -1, self.stride, -self.stride)
+
+        # Open-neighbour mask per padded cell and mask -> open offsets, so a
+        # search only visits the neighbours that are actually open
+        self.masks = bytearray(neighbor_masks(padded == 0).tobytes())
+        self.moves = tuple(tuple(offset for bit, offset in enumerate(self.offsets) if mask >> bit & 1)
+                           for mask in range(16))
+        self._spare = []  # Idle _Scratch tables, one per concurrent search
+        self._perfect = None
+        self._tree_index = None
+        self._junction_graph = None
+
+    @property
+    def is_perfect(self):
+        """True if the open cells contain no loops, so every path is unique"""
+        if self._perfect is None:
+            open_cells = self.maze == 0
+            nodes = int(open_cells.sum())
+            edges = int((open_cells[:, 1:] & open_cells[:, :-1]).sum() +
+                        (open_cells[1:] & open_cells[:-1]).sum())
+            # A forest has exactly one edge fewer than nodes per component
+            self._perfect = edges == nodes - self._count_components()
+        return self._perfect
+
+    @property
+    def cell_masks(self):
+        """Read-only (height, width) view of the neighbour masks"""
+        padded = np.frombuffer(self.masks, dtype=np.uint8).reshape(self.height + 2, self.stride)
+        view = padded[1:-1, 1:-1]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def tree_index(self):
+        """MazeTreeIndex for this maze (built once), or None if it has loops"""
+        if self._tree_index is None and self.is_perfect:
+            from maze_tree import MazeTreeIndex
+            self._tree_index = MazeTreeIndex(self)
+        return self._tree_index
+
+    @property
+    def junction_graph(self):
+        """Corridor-compressed JunctionGraph for this maze (built once)"""
+        if self._junction_graph is None:
+            from maze_graph import JunctionGraph
+            self._junction_graph = JunctionGraph(self)
+        return self._junction_graph
+
+    def _count_components(self):
+        free = bytearray(self.open)
+        masks, moves = self.masks, self.moves
+        components = 0
+        index = free.find(1)
+        while index >= 0:
+            components += 1
+            free[index] = 0
+            stack = [index]
+            while stack:
+                current = stack.pop()
+                for offset in moves[masks[current]]:
+                    neighbor = current + offset
+                    if free[neighbor]:
+                        free[neighbor] = 0
+                        stack.append(neighbor)
+            index = free.find(1, index)
+        return components
+
+    # --- Flat index helpers ---
+
+    def _index(self, cell):
+        """Flat index of an (x, y) cell, or -1 if it is outside the maze"""
+        x, y = cell
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return (int(y) + 1) * self.stride + int(x) + 1
+        return -1
+
+    def _cell(self, index):
+        y, x = divmod(index, self.stride)
+        return (x - 1, y - 1)
+
+    def _trace_indices(self, prev, src, dst):
+        """Walk a predecessor table back from dst to src (flat indices)"""
+        path = [dst]
+        current = dst
+        while current != src:
+            current = prev[current]
+            path.append(current)
+        path.reverse()
+        return path
+
+    def _trace(self, prev, src, dst):
+        """Walk a predecessor table back from dst to src ((x, y) cells)"""
+        return [self._cell(index) for index in self._trace_indices(prev, src, dst)]
+
+    def _new_prev(self):
+        return array('i', [-1]) * self.size
+
+    @contextmanager
+    def _scratch(self):
+        """Borrow a _Scratch for one search; it is reset and pooled afterwards"""
+        try:
+            scratch = self._spare.pop()
+        except IndexError:  # None free, e.g. another thread is searching
+            scratch = _Scratch(self.size)
+        try:
+            yield scratch
+        finally:
+            scratch.reset()
+            self._spare.append(scratch)
+
+    # --- Flat search engines ---
+
+    def _flood(self, src):
+        """BFS over every cell reachable from src; returns (prev, order)
+
+        Allocates its own predecessor table, since DistanceField keeps it.
+        """
+        free = bytearray(self.open)  # Cleared as cells are discovered
+        masks, moves = self.masks, self.moves
+        prev = self._new_prev()
+        prev[src] = src
+        free[src] = 0
+        order = [src]
+        append = order.append
+
+        # Iterating a list while appending to it makes it a FIFO queue
+        for current in order:
+            for offset in moves[masks[current]]:
+                neighbor = current + offset
+                if free[neighbor]:
+                    free[neighbor] = 0
+                    prev[neighbor] = current
+                    append(neighbor)
+
+        return prev, order
+
+    def _bfs(self, src, dst, scratch):
+        """BFS over flat indices; returns (prev, discovery order)"""
+        masks, moves = self.masks, self.moves
+        prev = scratch.table("prev")
+        scratch.touched = order = [src]
+        prev[src] = src
+        append = order.append
+
+        # Iterating a list while appending to it makes it a FIFO queue
+        for current in order:
+            if current == dst:
                 break
-            
-            x, y = current
-            for dx, dy in [(1,0), (-1,0), (0,1), (0,-1)]:
-                nx, ny = x + dx, y + dy
-                neighbor = (nx, ny)
-                
-                if (0 <= nx < self.width and 0 <= ny < self.height and 
-                    self.maze[ny][nx] == 0 and neighbor not in visited):
-                    queue.append(neighbor)
-                    visited[neighbor] = current
-        
-        # Reconstruct path
-        path = []
-        if end in visited:
-            current = end
-            while current != start:
-                path.append(current)
-                current = visited[current]
-            path.append(start)
-            path.reverse()
-        
-        return path, visited.keys()
-    
-    def solve_dfs(self, start, end):
-        """Depth-First Search - doesn't guarantee shortest path"""
-        stack = [start]
-        visited = {start: None}
-        
+            for offset in moves[masks[current]]:
+                neighbor = current + offset
+                if prev[neighbor] < 0:
+                    prev[neighbor] = current
+                    append(neighbor)
+
+        return prev, order
+
+    def _bfs_multi(self, src, goals, scratch):
+        """BFS from src that stops once every cell in goals is discovered"""
+        masks, moves, open_ = self.masks, self.moves, self.open
+        prev = scratch.table("prev")
+        scratch.touched = order = [src]
+        prev[src] = src
+        wanted = {goal for goal in goals if open_[goal] and goal != src}
+
+        append = order.append
+        for current in order:
+            if not wanted:
+                break
+            for offset in moves[masks[current]]:
+                neighbor = current + offset
+                if prev[neighbor] < 0:
+                    prev[neighbor] = current
+                    append(neighbor)
+                    wanted.discard(neighbor)
+        return prev
+
+    def _bfs_local(self, src, dst, limit):
+        """BFS that gives up after discovering limit cells
+
+        Uses a dict for predecessors so the cost depends only on the cells
+        touched, never on maze size. Returns the index path or None.
+        """
+        masks, moves = self.masks, self.moves
+        prev = {src: src}
+        order = [src]
+        for current in order:
+            if current == dst:
+                path = [dst]
+                while current != src:
+                    current = prev[current]
+                    path.append(current)
+                path.reverse()
+                return path
+            for offset in moves[masks[current]]:
+                neighbor = current + offset
+                if neighbor not in prev:
+                    prev[neighbor] = current
+                    order.append(neighbor)
+            if len(order) > limit:
+                return None
+        return None
+
+    def _dfs(self, src, dst, scratch):
+        """DFS over flat indices in random direction order"""
+        masks, moves = self.masks, self.moves
+        prev = scratch.table("prev")
+        scratch.touched = order = [src]
+        prev[src] = src
+        stack = [src]
+
         while stack:
             current = stack.pop()
-            
-            if current == end:
+            if current == dst:
                 break
-            
-            x, y = current
+
             # Explore in random order for more natural DFS
-            directions = [(1,0), (-1,0), (0,1), (0,-1)]
+            directions = list(moves[masks[current]])
             random.shuffle(directions)
-            
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                neighbor = (nx, ny)
-                
-                if (0 <= nx < self.width and 0 <= ny < self.height and 
-                    self.maze[ny][nx] == 0 and neighbor not in visited):
+            for offset in directions:
+                neighbor = current + offset
+                if prev[neighbor] < 0:
+                    prev[neighbor] = current
                     stack.append(neighbor)
-                    visited[neighbor] = current
-        
-        # Reconstruct path
-        path = []
-        if end in visited:
-            current = end
-            while current != start:
-                path.append(current)
-                current = visited[current]
-            path.append(start)
-            path.reverse()
-        
-        return path, visited.keys()
-    
-    def solve_a_star(self, start, end):
-        """A* Search - efficient with heuristics"""
-        def heuristic(a, b):
-            return abs(a[0] - b[0]) + abs(a[1] - b[1])
-        
-        open_set = []
-        heapq.heappush(open_set, (0, start))
-        came_from = {}
-        g_score = {start: 0}
-        f_score = {start: heuristic(start, end)}
-        
-        visited = set()
-        
+                    order.append(neighbor)
+
+        return prev, order
+
+    def _a_star(self, src, dst, scratch):
+        """A* over flat indices with a Manhattan heuristic"""
+        masks, moves, stride = self.masks, self.moves, self.stride
+        prev = scratch.table("prev")
+        g_score = scratch.table("dist")
+        closed = scratch.table("closed")
+        scratch.touched = touched = [src]  # Every cell given a g score
+        expanded = []
+
+        dst_y, dst_x = divmod(dst, stride) if dst >= 0 else (0, 0)
+
+        def heuristic(index):
+            y, x = divmod(index, stride)
+            return abs(x - dst_x) + abs(y - dst_y)
+
+        g_score[src] = 0
+        open_set = [(heuristic(src), src)]
+
         while open_set:
             current = heapq.heappop(open_set)[1]
-            visited.add(current)
-            
-            if current == end:
+            if closed[current]:
+                continue
+            closed[current] = 1
+            expanded.append(current)
+
+            if current == dst:
                 break
-            
-            x, y = current
-            for dx, dy in [(1,0), (-1,0), (0,1), (0,-1)]:
-                nx, ny = x + dx, y + dy
-                neighbor = (nx, ny)
-                
-                if (0 <= nx < self.width and 0 <= ny < self.height and 
-                    self.maze[ny][nx] == 0):
-                    tentative_g = g_score[current] + 1
-                    
-                    if neighbor not in g_score or tentative_g < g_score[neighbor]:
-                        came_from[neighbor] = current
-                        g_score[neighbor] = tentative_g
-                        f_score[neighbor] = tentative_g + heuristic(neighbor, end)
-                        if neighbor not in visited:
-                            heapq.heappush(open_set, (f_score[neighbor], neighbor))
-        
-        # Reconstruct path
-        path = []
-        if end in came_from:
-            current = end
-            while current != start:
-                path.append(current)
-                current = came_from[current]
-            path.append(start)
-            path.reverse()
-        
-        return path, visited
-    
-    def solve_dijkstra(self, start, end):
-        """Dijkstra's Algorithm - uniform cost search"""
-        distances = {start: 0}
-        previous = {}
-        nodes = set()
-        
-        # Initialize nodes
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.maze[y][x] == 0:
-                    node = (x, y)
-                    nodes.add(node)
-                    if node not in distances:
-                        distances[node] = float('inf')
-        
-        while nodes:
-            # Get node with smallest distance
-            current = min(nodes, key=lambda node: distances[node])
-            nodes.remove(current)
-            
-            if current == end:
+
+            tentative_g = g_score[current] + 1
+            for offset in moves[masks[current]]:
+                neighbor = current + offset
+                if not closed[neighbor]:
+                    old_g = g_score[neighbor]
+                    if old_g == -1:
+                        touched.append(neighbor)
+                    elif tentative_g >= old_g:
+                        continue
+                    prev[neighbor] = current
+                    g_score[neighbor] = tentative_g
+                    heapq.heappush(open_set, (tentative_g + heuristic(neighbor), neighbor))
+
+        return prev, expanded
+
+    def _dijkstra(self, src, dst, scratch, weights=None):
+        """Heap Dijkstra over flat indices with optional per-cell entry costs"""
+        masks, moves = self.masks, self.moves
+        prev = scratch.table("prev")
+        dist = scratch.table("cost")
+        done = scratch.table("closed")
+        scratch.touched = touched = [src]  # src plus every cell reached
+        reached = []
+
+        cost = None
+        if weights is not None:
+            cost = array('d', np.pad(np.asarray(weights, dtype=float), 1).tobytes())
+
+        dist[src] = 0
+        heap = [(0, src)]
+
+        while heap:
+            d, current = heapq.heappop(heap)
+            if done[current]:
+                continue  # Stale entry
+            done[current] = 1
+
+            if current == dst:
+                break
+
+            for offset in moves[masks[current]]:
+                neighbor = current + offset
+                if not done[neighbor]:
+                    alt = d + (1 if cost is None else cost[neighbor])
+                    if alt < dist[neighbor]:
+                        if prev[neighbor] == -1:
+                            touched.append(neighbor)
+                            reached.append(neighbor)
+                        dist[neighbor] = alt
+                        prev[neighbor] = current
+                        heapq.heappush(heap, (alt, neighbor))
+
+        return prev, reached
+
+    def _bidirectional_bfs(self, src, dst, scratch):
+        """BFS from both ends, always growing the smaller frontier by a level
+
+        Returns (forward prev, backward prev, meeting edge or None, cells seen).
+        """
+        masks, moves = self.masks, self.moves
+        prev_f, prev_b = scratch.table("prev"), scratch.table("prev_b")
+        dist_f, dist_b = scratch.table("dist"), scratch.table("dist_b")
+        scratch.touched = seen = [src] if src == dst else [src, dst]
+        prev_f[src], prev_b[dst] = src, dst
+        dist_f[src], dist_b[dst] = 0, 0
+        front_f, front_b = [src], [dst]
+        if src == dst:
+            return prev_f, prev_b, (src, src), seen
+
+        best, meet = -1, None
+        while front_f and front_b:
+            forward = len(front_f) <= len(front_b)
+            if forward:
+                front, prev, dist, other = front_f, prev_f, dist_f, dist_b
+            else:
+                front, prev, dist, other = front_b, prev_b, dist_b, dist_f
+
+            # Expand one whole level, keeping the shortest meeting found in it
+            grown = []
+            for current in front:
+                depth = dist[current] + 1
+                for offset in moves[masks[current]]:
+                    neighbor = current + offset
+                    if other[neighbor] >= 0:
+                        total = depth + other[neighbor]
+                        if best < 0 or total < best:
+                            best = total
+                            meet = (current, neighbor) if forward else (neighbor, current)
+                    if dist[neighbor] < 0:
+                        dist[neighbor] = depth
+                        prev[neighbor] = current
+                        grown.append(neighbor)
+                        seen.append(neighbor)
+            if best >= 0:
                 break
-            
-            if distances[current] == float('inf'):
+
+            if forward:
+                front_f = grown
+            else:
+                front_b = grown
+
+        return prev_f, prev_b, meet, seen
+
+    def _jump(self, current, step, dst):
+        """Follow step from current until a jump point (or -1 on a wall)
+
+        4-connected jump rules: a cell is a jump point if it is the goal or
+        has a forced neighbour (an open side cell whose cell behind is
+        blocked). Vertical scans also stop where a horizontal scan would
+        find a jump point.
+        """
+        open_ = self.open
+        horizontal = step == 1 or step == -1
+        side = self.stride if horizontal else 1
+
+        while True:
+            current += step
+            if not open_[current]:
+                return -1
+            if current == dst:
+                return current
+            behind = current - step
+            if ((open_[current + side] and not open_[behind + side]) or
+                    (open_[current - side] and not open_[behind - side])):
+                return current
+            if not horizontal and (self._jump(current, 1, dst) >= 0 or
+                                   self._jump(current, -1, dst) >= 0):
+                return current
+
+    def _jps(self, src, dst, scratch):
+        """A* over jump points; returns (prev over jump points, expanded)"""
+        stride = self.stride
+        prev = scratch.table("prev")
+        g_score = scratch.table("dist")
+        closed = scratch.table("closed")
+        scratch.touched = touched = [src]  # Every jump point given a g score
+        expanded = []
+
+        dst_y, dst_x = divmod(dst, stride)
+
+        def manhattan(a, b_y, b_x):
+            y, x = divmod(a, stride)
+            return abs(x - b_x) + abs(y - b_y)
+
+        g_score[src] = 0
+        prev[src] = src
+        open_set = [(manhattan(src, dst_y, dst_x), src)]
+
+        while open_set:
+            current = heapq.heappop(open_set)[1]
+            if closed[current]:
+                continue
+            closed[current] = 1
+            expanded.append(current)
+
+            if current == dst:
                 break
-            
-            x, y = current
-            for dx, dy in [(1,0), (-1,0), (0,1), (0,-1)]:
-                nx, ny = x + dx, y + dy
-                neighbor = (nx, ny)
-                
-                if neighbor in nodes:
-                    alt = distances[current] + 1
-                    if alt < distances[neighbor]:
-                        distances[neighbor] = alt
-                        previous[neighbor] = current
-        
-        # Reconstruct path
+
+            # Prune directions using the direction we arrived from
+            parent = prev[current]
+            if parent == current:
+                directions = self.offsets
+            else:
+                delta = current - parent
+                if abs(delta) < stride:
+                    step = 1 if delta > 0 else -1
+                    directions = (step, stride, -stride)
+                else:
+                    step = stride if delta > 0 else -stride
+                    directions = (step, 1, -1)
+
+            cur_y, cur_x = divmod(current, stride)
+            for step in directions:
+                point = self._jump(current, step, dst)
+                if point < 0 or closed[point]:
+                    continue
+                tentative_g = g_score[current] + manhattan(point, cur_y, cur_x)
+                old_g = g_score[point]
+                if old_g == -1:
+                    touched.append(point)
+                elif tentative_g >= old_g:
+                    continue
+                g_score[point] = tentative_g
+                prev[point] = current
+                heapq.heappush(open_set, (tentative_g + manhattan(point, dst_y, dst_x), point))
+
+        return prev, expanded
+
+    # --- Public API: (x, y) tuples in, (path, visited) out ---
+
+    def solve_bfs(self, start, end):
+        """Breadth-First Search - guarantees shortest path"""
+        src, dst = self._index(start), self._index(end)
+        if src < 0:
+            return [], {start: None}.keys()
+        with self._scratch() as scratch:
+            prev, order = self._bfs(src, dst, scratch)
+
+            # Reconstruct path
+            path = self._trace(prev, src, dst) if dst >= 0 and prev[dst] != -1 else []
+        return path, dict.fromkeys(map(self._cell, order)).keys()
+
+    def solve_tree(self, start, end):
+        """Path lookup on a perfect maze through the tree index - no search
+
+        Returns the same (path, visited) shape; visited is just the path.
+        """
+        index = self.tree_index
+        if index is None:
+            raise ValueError("solve_tree needs a perfect (loop-free) maze")
+        path = index.path(start, end)
+        return path, set(path)
+
+    def solve_junction(self, start, end):
+        """Shortest path searched on the junction graph
+
+        Corridors are walked as single weighted edges, so only junctions and
+        dead ends are expanded. visited holds the expanded node cells.
+        """
+        return self.junction_graph.solve(start, end)
+
+    def solve_local(self, start, end, limit=64):
+        """Shortest path if end is within a small neighbourhood of start
+
+        Explores at most ``limit`` cells and returns ``[]`` if end was not
+        found by then. Useful for cheap incremental updates.
+        """
+        src, dst = self._index(start), self._index(end)
+        if src < 0 or dst < 0:
+            return []
+        path = self._bfs_local(src, dst, limit)
+        return [self._cell(index) for index in path] if path else []
+
+    def solve_bidirectional(self, start, end):
+        """Bidirectional BFS - shortest path, meeting in the middle
+
+        visited holds every cell discovered by either search.
+        """
+        src, dst = self._index(start), self._index(end)
+        if src < 0 or dst < 0:
+            return [], {start}
+        with self._scratch() as scratch:
+            prev_f, prev_b, meet, seen = self._bidirectional_bfs(src, dst, scratch)
+
+            # Reconstruct path: src -> meet[0] forwards, then meet[1] -> dst
+            path = []
+            if meet is not None:
+                path = self._trace(prev_f, src, meet[0])
+                if meet[1] != meet[0]:
+                    path.extend(reversed(self._trace(prev_b, dst, meet[1])))
+        return path, set(map(self._cell, seen))
+
+    def solve_jps(self, start, end):
+        """Jump Point Search - A* that skips straight runs through open rooms
+
+        visited holds only the expanded jump points, so it is directly
+        comparable with the expansions of solve_a_star.
+        """
+        src, dst = self._index(start), self._index(end)
+        if src < 0 or dst < 0 or not self.open[dst]:
+            return [], {start}
+        with self._scratch() as scratch:
+            prev, expanded = self._jps(src, dst, scratch)
+            points = self._trace(prev, src, dst) if prev[dst] != -1 else []
+
+        # Fill in the straight runs between jump points
         path = []
-        if end in previous:
-            current = end
-            while current != start:
-                path.append(current)
-                current = previous[current]
-            path.append(start)
-            path.reverse()
-        
-        return path, set(previous.keys())
\ No newline at end of file
+        if points:
+            path.append(points[0])
+            for (x0, y0), (x1, y1) in zip(points, points[1:]):
+                dx, dy = (x1 > x0) - (x1 < x0), (y1 > y0) - (y1 < y0)
+                x, y = x0, y0
+                while (x, y) != (x1, y1):
+                    x, y = x + dx, y + dy
+                    path.append((x, y))
+        return path, set(map(self._cell, expanded))
+
+    def _path_array(self, indices):
+        """Flat indices to an int32 array of (x, y) rows"""
+        index = np.asarray(indices, dtype=np.int64)
+        y, x = np.divmod(index, self.stride)
+        return np.column_stack((x - 1, y - 1)).astype(np.int32)
+
+    def solve_path(self, start, end, algorithm="bfs"):
+        """Only the path, as a compact int32 array of (x, y) rows
+
+        Skips building the visited collection that the solve_* methods
+        return, so no exploration state outlives the call. ``algorithm`` is
+        one of "bfs", "dfs", "a_star", "dijkstra", "bidirectional" or "jps".
+        Returns an empty (0, 2) array if there is no path.
+        """
+        src, dst = self._index(start), self._index(end)
+        empty = np.empty((0, 2), dtype=np.int32)
+        if src < 0 or dst < 0:
+            return empty
+        if src == dst:
+            return self._path_array([src])
+
+        if algorithm == "bidirectional":
+            with self._scratch() as scratch:
+                prev_f, prev_b, meet, _ = self._bidirectional_bfs(src, dst, scratch)
+                if meet is None:
+                    return empty
+                back = self._trace_indices(prev_b, dst, meet[1])
+                indices = self._trace_indices(prev_f, src, meet[0]) + back[::-1]
+            return self._path_array(indices)
+
+        engines = {"bfs": self._bfs, "dfs": self._dfs, "a_star": self._a_star,
+                   "dijkstra": self._dijkstra, "jps": self._jps}
+        if algorithm not in engines:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        with self._scratch() as scratch:
+            prev, _ = engines[algorithm](src, dst, scratch)
+            if prev[dst] == -1:
+                return empty
+            indices = self._trace_indices(prev, src, dst)
+
+        path = self._path_array(indices)
+        if algorithm == "jps":
+            # Fill in the straight runs between jump points
+            steps = [path[:1]]
+            for a, b in zip(path[:-1], path[1:]):
+                count = int(np.abs(b - a).sum())
+                steps.append(a + np.outer(np.arange(1, count + 1), np.sign(b - a)))
+            path = np.concatenate(steps).astype(np.int32)
+        return path
+
+    def solve_many(self, pairs):
+        """Shortest paths for many (start, end) pairs at once
+
+        Pairs are grouped by start or by end, whichever gives fewer groups,
+        and each group is served by one BFS that stops once all of its
+        other endpoints are found. Returns a list of paths in the order of
+        ``pairs``; a pair with no path, or with a wall at either end, gets
+        ``[]``.
+        """
+        pairs = [(self._index(start), self._index(end)) for start, end in pairs]
+        paths = [[] for _ in pairs]
+
+        # Paths are reversible, so searching from the ends works too
+        by_start, by_end = {}, {}
+        for i, (src, dst) in enumerate(pairs):
+            if src >= 0 and dst >= 0 and self.open[src] and self.open[dst]:
+                by_start.setdefault(src, []).append(i)
+                by_end.setdefault(dst, []).append(i)
+        from_end = len(by_end) < len(by_start)
+        groups = by_end if from_end else by_start
+
+        for root, members in groups.items():
+            others = [pairs[i][0] if from_end else pairs[i][1] for i in members]
+            with self._scratch() as scratch:
+                prev = self._bfs_multi(root, others, scratch)
+                for i, other in zip(members, others):
+                    if prev[other] == -1:
+                        continue
+                    path = self._trace(prev, root, other)
+                    if from_end:
+                        path.reverse()
+                    paths[i] = path
+        return paths
+
+    def trace_bfs(self, start, end):
+        """Generator for animating BFS: yields each new frontier level
+
+        Each item is the list of (x, y) cells discovered in one BFS level.
+        Only the current level is materialised as tuples. The generator's
+        return value is the path (use ``path = yield from ...``).
+        """
+        src, dst = self._index(start), self._index(end)
+        if src < 0:
+            return []
+        with self._scratch() as scratch:
+            prev = scratch.table("prev")
+            scratch.touched = touched = [src]
+            prev[src] = src
+            frontier = [src]
+            yield [self._cell(src)]
+
+            while frontier and src != dst:
+                grown = []
+                for current in frontier:
+                    for offset in self.moves[self.masks[current]]:
+                        neighbor = current + offset
+                        if prev[neighbor] == -1:
+                            prev[neighbor] = current
+                            grown.append(neighbor)
+                if not grown:
+                    break
+                touched.extend(grown)
+                yield [self._cell(index) for index in grown]
+                if dst >= 0 and prev[dst] != -1:
+                    break
+                frontier = grown
+
+            if dst < 0 or prev[dst] == -1:
+                return []
+            return self._trace(prev, src, dst)
+
+    def solve_dfs(self, start, end):
+        """Depth-First Search - doesn't guarantee shortest path"""
+        src, dst = self._index(start), self._index(end)
+        if src < 0:
+            return [], {start: None}.keys()
+        with self._scratch() as scratch:
+            prev, order = self._dfs(src, dst, scratch)
+
+            # Reconstruct path
+            path = self._trace(prev, src, dst) if dst >= 0 and prev[dst] != -1 else []
+        return path, dict.fromkeys(map(self._cell, order)).keys()
+
+    def solve_a_star(self, start, end):
+        """A* Search - efficient with heuristics"""
+        src, dst = self._index(start), self._index(end)
+        if src < 0:
+            return [], {start}
+        with self._scratch() as scratch:
+            prev, expanded = self._a_star(src, dst, scratch)
+
+            # Reconstruct path
+            path = []
+            if dst >= 0 and dst != src and prev[dst] != -1:
+                path = self._trace(prev, src, dst)
+        return path, set(map(self._cell, expanded))
+
+    def solve_dijkstra(self, start, end, weights=None):
+        """Dijkstra's Algorithm - uniform cost search
+
+        Uses a binary heap with lazy deletion: stale heap entries are skipped
+        when popped, and only cells that are actually reached are touched.
+        ``weights`` is an optional array shaped like the maze giving the cost
+        of stepping onto each cell (default 1 everywhere).
+        """
+        src, dst = self._index(start), self._index(end)
+        if src < 0:
+            return [], set()
+        with self._scratch() as scratch:
+            prev, reached = self._dijkstra(src, dst, scratch, weights)
+
+            # Reconstruct path
+            path = []
+            if dst >= 0 and dst != src and prev[dst] != -1:
+                path = self._trace(prev, src, dst)
+        return path, set(map(self._cell, reached))
+
+    def distance_field(self, target):
+        """Distances from every cell to target, from a single BFS"""
+        return DistanceField(self, target)
+
+    def flow_field(self, target=None):
+        """Retargetable next-step directions towards target (e.g. the player)"""
+        return FlowField(self, target)
+
+
+class DistanceField:
+    """Distance-to-target for every cell of a maze.
+
+    Built with one BFS outward from ``target``. The BFS predecessor of each
+    cell is its next step towards the target, so the distance and the next
+    step from any cell are O(1) lookups, and a full hint path costs only its
+    own length. Unreachable cells have distance -1.
+    """
+
+    def __init__(self, solver, target):
+        if not isinstance(solver, MazeSolver):
+            solver = MazeSolver(solver)
+        self.solver = solver
+        self.target = target
+
+        self._dist = array('i', [-1]) * solver.size
+        src = solver._index(target)
+        if src < 0:
+            self._next = solver._new_prev()
+            return
+
+        self._next, order = solver._flood(src)
+        dist, next_ = self._dist, self._next
+        dist[src] = 0
+        for index in order[1:]:
+            dist[index] = dist[next_[index]] + 1
+
+    def distance(self, cell):
+        """Steps from cell to the target, or -1 if unreachable"""
+        index = self.solver._index(cell)
+        return self._dist[index] if index >= 0 else -1
+
+    def next_step(self, cell):
+        """Neighbouring cell one step closer to the target, or None"""
+        index = self.solver._index(cell)
+        if index < 0 or self._dist[index] <= 0:
+            return None
+        return self.solver._cell(self._next[index])
+
+    def path_from(self, cell):
+        """Shortest path from cell to the target (inclusive), or []"""
+        index = self.solver._index(cell)
+        if index < 0 or self._dist[index] < 0:
+            return []
+        cell_of, next_ = self.solver._cell, self._next
+        path = [cell_of(index)]
+        while self._dist[index] > 0:
+            index = next_[index]
+            path.append(cell_of(index))
+        return path
+
+    def as_array(self):
+        """Distances as an int32 array shaped like the maze"""
+        solver = self.solver
+        padded = np.frombuffer(self._dist, dtype=np.int32).reshape(solver.height + 2, solver.stride)
+        return padded[1:-1, 1:-1].copy()
+
+
+class FlowField:
+    """Next-step direction towards a moving target for every cell.
+
+    Holds a DistanceField for the target's current cell plus a uint8 array
+    with the neighbour-mask bit (RIGHT, LEFT, DOWN or UP) of the shortest
+    step from each cell, 0 where there is none. ``update`` rebuilds it only
+    when the target changes cell, so any number of chasers can share one
+    field and get a wall-aware next move with a single array read.
+    """
+
+    def __init__(self, solver, target=None):
+        if not isinstance(solver, MazeSolver):
+            solver = MazeSolver(solver)
+        self.solver = solver
+        self.target = None
+        self.field = None
+        self.rebuilds = 0
+        self.directions = np.zeros((solver.height, solver.width), dtype=np.uint8)
+        self.distances = np.full((solver.height, solver.width), -1, dtype=np.int32)
+        shape = (solver.height + 2, solver.stride)
+        self._index = np.arange(solver.size, dtype=np.int32).reshape(shape)[1:-1, 1:-1]
+        if target is not None:
+            self.update(target)
+
+    def update(self, target):
+        """Point the field at target's cell; returns True if it was rebuilt"""
+        cell = (int(round(target[0])), int(round(target[1])))
+        if cell == self.target:
+            return False
+        self.target = cell
+        self.rebuilds += 1
+
+        solver = self.solver
+        self.field = field = DistanceField(solver, cell)
+        shape = (solver.height + 2, solver.stride)
+        dist = np.frombuffer(field._dist, dtype=np.int32).reshape(shape)[1:-1, 1:-1]
+        next_ = np.frombuffer(field._next, dtype=np.int32).reshape(shape)[1:-1, 1:-1]
+
+        # Turn each predecessor offset into its direction bit
+        step = np.where(dist > 0, next_ - self._index, 0)
+        directions = np.zeros(step.shape, dtype=np.uint8)
+        for offset, bit in zip(solver.offsets, (RIGHT, LEFT, DOWN, UP)):
+            directions[step == offset] = bit
+        self.directions = directions
+        self.distances = dist.copy()
+        return True
+
+    def distance(self, cell):
+        """Steps from cell to the target, or -1 if unreachable"""
+        x, y = cell
+        if 0 <= x < self.solver.width and 0 <= y < self.solver.height:
+            return int(self.distances[y, x])
+        return -1
+
+    def next_step(self, cell):
+        """Neighbouring cell one step closer to the target, or None"""
+        x, y = cell
+        if not (0 <= x < self.solver.width and 0 <= y < self.solver.height):
+            return None
+        bit = int(self.directions[y, x])
+        if not bit:
+            return None
+        dx, dy = DIRECTIONS[bit.bit_length() - 1]
+        return (x + dx, y + dy)
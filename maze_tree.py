@@ -0,0 +1,134 @@
+from array import array
+
+import numpy as np
+
+from maze_solver import MazeSolver
+
+
+class MazeTreeIndex:
+    """Path queries on a perfect (loop-free) maze via lowest common ancestors.
+
+    A perfect maze is a spanning tree of its open cells (a forest if some
+    parts are unreachable), so the path between two cells is unique: it runs
+    up from each cell to their lowest common ancestor. Built once in
+    O(n log n) with one BFS and binary-lifting tables, after which path
+    length is O(log n) and the path itself is O(length), with no search.
+    """
+
+    def __init__(self, maze):
+        solver = maze if isinstance(maze, MazeSolver) else MazeSolver(maze)
+        if not solver.is_perfect:
+            raise ValueError("MazeTreeIndex needs a perfect (loop-free) maze")
+        self.solver = solver
+
+        # BFS every component, numbering nodes in discovery order
+        free = bytearray(solver.open)
+        masks, moves = solver.masks, solver.moves
+        node_of = array('i', [-1]) * solver.size
+        index_of = []
+        parent = []
+        depth = []
+        root_of = []
+
+        root = free.find(1)
+        while root >= 0:
+            root_id = len(index_of)
+            free[root] = 0
+            node_of[root] = root_id
+            index_of.append(root)
+            parent.append(root_id)
+            depth.append(0)
+            root_of.append(root_id)
+
+            head = root_id
+            while head < len(index_of):
+                current = index_of[head]
+                child_depth = depth[head] + 1
+                for offset in moves[masks[current]]:
+                    neighbor = current + offset
+                    if free[neighbor]:
+                        free[neighbor] = 0
+                        node_of[neighbor] = len(index_of)
+                        index_of.append(neighbor)
+                        parent.append(head)
+                        depth.append(child_depth)
+                        root_of.append(root_id)
+                head += 1
+            root = free.find(1, root)
+
+        self._node_of = node_of
+        self._index_of = array('i', index_of)
+        self._depth = array('i', depth)
+        self._root_of = array('i', root_of)
+
+        # up[k][v] is the 2**k-th ancestor of v (roots point to themselves)
+        up = [np.array(parent, dtype=np.int32)]
+        for _ in range(max(depth, default=0).bit_length() - 1):
+            up.append(up[-1][up[-1]])
+        self._up = up
+        self._parent = array('i', parent)
+
+    def __len__(self):
+        return len(self._index_of)
+
+    def _node(self, cell):
+        index = self.solver._index(cell)
+        return self._node_of[index] if index >= 0 else -1
+
+    def _lca(self, u, v):
+        depth, up = self._depth, self._up
+        if depth[u] < depth[v]:
+            u, v = v, u
+
+        # Lift u to v's depth
+        diff = depth[u] - depth[v]
+        k = 0
+        while diff:
+            if diff & 1:
+                u = int(up[k][u])
+            diff >>= 1
+            k += 1
+        if u == v:
+            return u
+
+        # Lift both to just below their common ancestor
+        for table in reversed(up):
+            if table[u] != table[v]:
+                u, v = int(table[u]), int(table[v])
+        return self._parent[u]
+
+    def lca(self, a, b):
+        """Lowest common ancestor cell of a and b, or None if not connected"""
+        u, v = self._node(a), self._node(b)
+        if u < 0 or v < 0 or self._root_of[u] != self._root_of[v]:
+            return None
+        return self.solver._cell(self._index_of[self._lca(u, v)])
+
+    def distance(self, a, b):
+        """Number of steps between a and b, or -1 if not connected"""
+        u, v = self._node(a), self._node(b)
+        if u < 0 or v < 0 or self._root_of[u] != self._root_of[v]:
+            return -1
+        depth = self._depth
+        return depth[u] + depth[v] - 2 * depth[self._lca(u, v)]
+
+    def path(self, a, b):
+        """The unique path from a to b (inclusive), or [] if not connected"""
+        u, v = self._node(a), self._node(b)
+        if u < 0 or v < 0 or self._root_of[u] != self._root_of[v]:
+            return []
+        top = self._lca(u, v)
+        parent, cell_of, index_of = self._parent, self.solver._cell, self._index_of
+
+        up_part = []
+        while u != top:
+            up_part.append(cell_of(index_of[u]))
+            u = parent[u]
+        down_part = []
+        while v != top:
+            down_part.append(cell_of(index_of[v]))
+            v = parent[v]
+
+        up_part.append(cell_of(index_of[top]))
+        down_part.reverse()
+        return up_part + down_part
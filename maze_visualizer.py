@@ -2,6 +2,7 @@ import pygame
 import numpy as np
 import math
 import time
+from maze_grid import maze_array
 
 class MazeVisualizer:
     def __init__(self, cell_size=25, margin=1):
@@ -49,6 +50,7 @@ class MazeVisualizer:
 
     def draw_maze_game(self, maze, player, snake, show_hint, hint_path):
         """Draws the main game screen (maze, player, snake, and UI background)."""
+        maze = maze_array(maze)
         self.screen.fill(self.WALL_COLOR) # Fill background with wall color
 
         # Draw the maze cells
@@ -104,7 +106,7 @@ class MazeVisualizer:
 
     def draw_snake(self, snake, maze_width):
         """Draws the Snake."""
-        if not snake.is_active and snake.start_delay > 0 and not snake.activation_time < pygame.time.get_ticks():
+        if not snake.is_active and snake.start_delay > 0 and not snake.activation_time < snake.clock.now_ms():
             # Draw a 'Zzz' icon when completely inactive/sleeping (before first move)
             if not getattr(self, 'game_started_flag', False): # Check if game hasn't started
                 text = self.bold_font.render("Zzz", True, (0, 150, 0))
@@ -201,7 +203,7 @@ class MazeVisualizer:
 
         elif not snake.is_active:
             # State 2: Countdown Active (After first move, before activation time)
-            delay_time_left = max(0, snake.activation_time - pygame.time.get_ticks()) / 1000
+            delay_time_left = max(0, snake.activation_time - snake.clock.now_ms()) / 1000
             
             if delay_time_left > 0:
                 status_text = self.bold_font.render("ACTIVATING IN...", True, self.END_COLOR)
@@ -0,0 +1,106 @@
+import os
+
+import numpy as np
+
+from maze_cache import MazeCache, SolveCache
+from maze_generator import MazeGenerator
+from maze_grid import MazeGrid
+from maze_solver import MazeSolver
+
+START, END = (0, 1), (10, 9)
+
+
+def small_maze():
+    return np.array(MazeGenerator(11, 11, seed=1).generate("dfs"))
+
+
+def test_maze_cache_evicts_least_recently_used():
+    cache = MazeCache(max_items=2)
+    a, b, c = (np.full((3, 3), i, dtype=np.uint8) for i in range(3))
+    cache.put("a", a)
+    cache.put("b", b)
+    assert np.array_equal(cache.get("a"), a)  # a is now the most recent
+    cache.put("c", c)
+    assert cache.get("b") is None
+    assert np.array_equal(cache.get("a"), a) and np.array_equal(cache.get("c"), c)
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_maze_cache_evicts_least_recently_used_files(tmp_path):
+    cache = MazeCache(max_items=0, cache_dir=str(tmp_path))
+    cache.put("a", small_maze())
+    cache.max_disk_bytes = 2 * os.path.getsize(cache._path("a"))
+    cache.put("b", small_maze())
+    os.utime(cache._path("a"), (1000, 1000))
+    os.utime(cache._path("b"), (2000, 2000))
+    assert cache.get("a") is not None  # Reading a file marks it as used
+    cache.put("c", small_maze())
+    assert not os.path.exists(cache._path("b"))
+    assert os.path.exists(cache._path("a")) and os.path.exists(cache._path("c"))
+
+    # A fresh cache on the same directory serves the files, memory-mapped
+    reopened = MazeCache(cache_dir=str(tmp_path))
+    assert isinstance(reopened.get("c"), np.memmap)
+    assert np.array_equal(reopened.get("a"), small_maze())
+
+
+def test_get_or_generate_only_generates_on_a_miss(tmp_path):
+    first, second = MazeCache(cache_dir=str(tmp_path)), MazeCache(cache_dir=str(tmp_path))
+    maze = first.get_or_generate(MazeGenerator(11, 11, seed=1), "dfs")
+    assert np.array_equal(maze, small_maze())
+    assert np.array_equal(second.get_or_generate(MazeGenerator(11, 11, seed=1), "dfs"), maze)
+    assert (first.hits, first.misses, second.hits, second.misses) == (0, 1, 1, 0)
+
+
+def test_solve_cache_hits_and_misses():
+    maze = small_maze()
+    cache = SolveCache()
+    first = cache.solve(maze, START, END)
+    assert cache.solve(maze, START, END) == first
+    assert cache.solve(maze, START, END, "a_star") == first
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 2)
+
+
+def test_solve_cache_sees_in_place_edits():
+    maze = small_maze()
+    cache = SolveCache()
+    assert cache.solve(maze, START, END)
+    maze[:, 5] = 1
+    assert cache.solve(maze, START, END) == []
+
+
+def test_solve_cache_sees_edits_through_read_only_views():
+    maze = small_maze()
+    view = maze.view()
+    view.flags.writeable = False
+    cache = SolveCache()
+    assert cache.solve(view, START, END)
+    maze[:, 5] = 1
+    assert cache.solve(view, START, END) == MazeSolver(maze).solve_bfs(START, END)[0] == []
+
+
+def test_solve_cache_sees_edits_after_writeable_is_restored():
+    maze = small_maze()
+    maze.flags.writeable = False
+    cache = SolveCache()
+    assert cache.solve(maze, START, END)
+    maze.flags.writeable = True
+    maze[:, 5] = 1
+    maze.flags.writeable = False
+    assert cache.solve(maze, START, END) == []
+
+
+def test_solve_cache_remembers_frozen_fingerprints():
+    maze = small_maze()
+    cache = SolveCache()
+    frozen = MazeCache().put(("dfs", 11, 11, 1), maze)
+    grid = MazeGrid(maze)
+    assert cache.fingerprint(frozen) == cache.fingerprint(grid) == cache.fingerprint(maze)
+    assert len(cache._digests) == 2
+    cache.fingerprint(frozen)
+    cache.fingerprint(grid)
+    assert len(cache._digests) == 2
+
+    del frozen, grid
+    assert not cache._digests
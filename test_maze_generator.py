@@ -0,0 +1,91 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+from maze_generator import MazeGenerator
+
+SIZES = [(3, 3), (5, 3), (3, 9), (21, 15), (40, 24)]  # Even sizes round up to odd
+
+
+def assert_perfect(maze):
+    """Every open cell is reachable from the entrance, with no loops"""
+    open_cells = np.asarray(maze) == 0
+    height, width = open_cells.shape
+    assert open_cells[1, 0] and open_cells[height - 2, width - 1]
+
+    seen = np.zeros_like(open_cells)
+    seen[1, 0] = True
+    queue = deque([(0, 1)])
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < width and 0 <= ny < height and open_cells[ny, nx] and not seen[ny, nx]:
+                seen[ny, nx] = True
+                queue.append((nx, ny))
+    assert np.array_equal(seen, open_cells)
+
+    edges = (open_cells[:, 1:] & open_cells[:, :-1]).sum() + (open_cells[1:] & open_cells[:-1]).sum()
+    assert edges == open_cells.sum() - 1
+
+
+@pytest.mark.parametrize("algorithm", ["binary_tree", "sidewinder"])
+@pytest.mark.parametrize("width, height", SIZES)
+def test_row_generators_are_perfect(algorithm, width, height):
+    for seed in range(5):
+        assert_perfect(MazeGenerator(width, height, seed=seed).generate(algorithm))
+
+
+
+@pytest.mark.parametrize("width, height", SIZES)
+def test_eller_is_perfect(width, height):
+    for seed in range(5):
+        maze = MazeGenerator(width, height, seed=seed).generate("eller")
+        assert maze.shape == (height | 1, width | 1)
+        assert_perfect(maze)
+
+
+def test_eller_rounds_rows_up_before_checking_them(tmp_path):
+    generator = MazeGenerator(11, 11, seed=4)
+    maze = generator.generate_eller_to_file(str(tmp_path / "maze.npy"), rows=2)
+    assert maze.shape == (3, 11)
+    assert_perfect(maze)
+    assert np.array_equal(np.vstack(list(MazeGenerator(11, 11, seed=4).iter_eller(rows=2))), maze)
+
+    for rows in (0, 1, -2):
+        with pytest.raises(ValueError):
+            generator.iter_eller(rows)
+        with pytest.raises(ValueError):
+            generator.generate_eller_to_file(str(tmp_path / "bad.npy"), rows=rows)
+    assert not (tmp_path / "bad.npy").exists()
+    with pytest.raises(ValueError):
+        MazeGenerator(11, 1).generate_eller()
+
+
+def test_eller_to_file_matches_in_memory(tmp_path):
+    maze = MazeGenerator(31, 9, seed=5).generate_eller_to_file(str(tmp_path / "maze.npy"), rows=41)
+    assert maze.shape == (41, 31)
+    assert_perfect(maze)
+    assert np.array_equal(maze, MazeGenerator(31, 41, seed=5).generate_eller())
+
+
+def test_division_golden_seed():
+    maze = MazeGenerator(21, 15, seed=2024).generate("division")
+    rows = ["".join("#" if cell else "." for cell in row) for row in np.asarray(maze)]
+    assert rows == [
+        "#####################",
+        "....................#",
+        "#................#..#",
+        "#.################..#",
+        "#....##..........#..#",
+        "#..#...###..#.#..#..#",
+        "#..#...###..#.#..#..#",
+        "#.###################",
+        "#.###################",
+        "#...................#",
+        "#...................#",
+        "#.###################",
+        "#...................#",
+        "#....................",
+        "#####################",
+    ]
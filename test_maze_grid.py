@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from maze_generator import MazeGenerator
+from maze_grid import MazeGrid, neighbor_masks
+
+
+@pytest.fixture
+def maze():
+    # 13 columns, so packed rows end in a partial byte
+    return np.array(MazeGenerator(13, 11, seed=3).generate("dfs"))
+
+
+def test_packed_grid_matches_unpacked(maze):
+    packed, plain = MazeGrid(maze, packed=True), MazeGrid(maze)
+    assert packed.nbytes == 11 * 2 < plain.nbytes
+    assert np.array_equal(packed.array, maze) and np.array_equal(plain.array, maze)
+    assert np.array_equal(packed.masks, neighbor_masks(maze))
+    for y in range(-1, 12):
+        for x in range(-1, 14):
+            assert packed.is_open(x, y) == plain.is_open(x, y)
+            assert packed.neighbors(x, y) == plain.neighbors(x, y)
+            assert packed.mask(x, y) == plain.mask(x, y)
+
+
+def test_packed_grid_indexing(maze):
+    packed = MazeGrid(maze, packed=True)
+    assert len(packed) == 11
+    assert np.array_equal(packed[4], maze[4])
+    assert np.array_equal(packed[2:5], maze[2:5])
+    assert packed[3, 12] == maze[3, 12] and packed[3][5] == maze[3][5]
+    assert np.array_equal(packed[1:4, 2:9], maze[1:4, 2:9])
+    assert not packed[4].flags.writeable
@@ -0,0 +1,72 @@
+import random
+import threading
+
+import pytest
+
+from maze_harness import HintBot
+from maze_sim import MobileMazeGame
+
+
+def test_start_level_waits_for_an_in_flight_prefetch():
+    game = MobileMazeGame(rng=random.Random(1))
+    build = game._build_level
+    release = threading.Event()
+    builds = []
+
+    def slow_build(level, seed):
+        builds.append(threading.current_thread() is threading.main_thread())
+        release.wait()
+        return build(level, seed)
+
+    game._build_level = slow_build
+    game.prefetch_level(3)
+    threading.Timer(0.05, release.set).start()
+    game.prefetch_enabled = False
+    game.start_level(3)
+    assert builds == [False]  # Built once, by the worker
+    assert game.maze.shape == (15, 15)
+
+
+def test_start_level_rebuilds_after_a_failed_prefetch():
+    game = MobileMazeGame(rng=random.Random(1))
+    build = game._build_level
+
+    def failing_build(level, seed):
+        raise RuntimeError("prefetch failed")
+
+    game._build_level = failing_build
+    game.prefetch_level(2)
+    game._build_level = build
+    game.prefetch_enabled = False
+    game.start_level(2)
+    assert game.game_state == "playing"
+    assert game.maze.shape == (11, 11)
+
+
+@pytest.mark.parametrize("level", [1, 4, 7])
+def test_snake_path_matches_fresh_bfs(level):
+    checks = 0
+    for seed in range(8):
+        game = MobileMazeGame(rng=random.Random(seed))
+        game.prefetch_enabled = False
+        game.level_configs[level] = {**game.level_configs[level], "snake_delay": 500}
+        game.start_level(level)
+        bot = HintBot(reaction_ticks=3, mistake_rate=0.4)
+        bot.reset(random.Random(seed))
+
+        for _ in range(2000):
+            if not game.player.moving:
+                direction = bot.choose(game)
+                if direction is not None:
+                    game.move_player(direction)
+            finished = game.step()
+
+            snake = game.snake
+            if snake.path:
+                # The path is walked from path_start and excludes it
+                fresh, _ = snake.solver.solve_bfs(snake.path_start, snake.path[-1])
+                assert list(snake.path) == fresh[1:]
+                checks += 1
+            if finished:
+                break
+    assert checks
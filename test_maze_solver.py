@@ -0,0 +1,108 @@
+import random
+
+import numpy as np
+import pytest
+
+from maze_generator import MazeGenerator
+from maze_solver import MazeSolver
+
+
+def looped(maze, seed, count=40):
+    """Copy of a perfect maze with count interior walls knocked out"""
+    maze = np.array(maze)
+    rng = np.random.default_rng(seed)
+    ys, xs = np.nonzero(maze[1:-1, 1:-1])
+    for i in rng.choice(len(ys), size=min(count, len(ys)), replace=False):
+        maze[ys[i] + 1, xs[i] + 1] = 0
+    return maze
+
+
+def open_pairs(maze, seed, count=40):
+    cells = [(int(x), int(y)) for y, x in zip(*np.nonzero(np.asarray(maze) == 0))]
+    rng = random.Random(seed)
+    return [tuple(rng.sample(cells, 2)) for _ in range(count)]
+
+
+def is_walk(maze, path, start, end):
+    """True if path runs from start to end through adjacent open cells"""
+    if path[0] != start or path[-1] != end:
+        return False
+    steps = zip(path, path[1:])
+    return (all(maze[y][x] == 0 for x, y in path) and
+            all(abs(x1 - x0) + abs(y1 - y0) == 1 for (x0, y0), (x1, y1) in steps))
+
+
+def check_against_bfs(maze, solve):
+    """Assert solve(solver, start, end) finds walks as short as BFS's"""
+    solver = MazeSolver(maze)
+    for start, end in open_pairs(maze, seed=len(maze) * len(maze[0])):
+        expected = len(solver.solve_bfs(start, end)[0])
+        path = solve(solver, start, end)
+        assert len(path) == expected
+        assert not path or is_walk(maze, path, start, end)
+
+
+MAZES = {
+    "dfs": lambda: MazeGenerator(31, 25, seed=7).generate("dfs"),
+    "prims": lambda: MazeGenerator(25, 31, seed=8).generate("prims"),
+    "dfs_looped": lambda: looped(MazeGenerator(31, 25, seed=9).generate("dfs"), seed=9),
+    "kruskals_looped": lambda: looped(MazeGenerator(27, 27, seed=10).generate("kruskals"), seed=10),
+}
+
+
+@pytest.mark.parametrize("name", sorted(MAZES))
+@pytest.mark.parametrize("method", ["solve_bidirectional", "solve_jps"])
+def test_bidirectional_and_jps_match_bfs(name, method):
+    check_against_bfs(MAZES[name](), lambda solver, start, end: getattr(solver, method)(start, end)[0])
+
+
+@pytest.mark.parametrize("name", ["dfs", "prims"])
+def test_tree_index_matches_bfs(name):
+    maze = MAZES[name]()
+    assert MazeSolver(maze).is_perfect
+    check_against_bfs(maze, lambda solver, start, end: solver.solve_tree(start, end)[0])
+
+
+def test_looped_mazes_have_no_tree_index():
+    assert MazeSolver(MAZES["dfs_looped"]()).tree_index is None
+
+
+@pytest.mark.parametrize("name", sorted(MAZES))
+def test_junction_graph_matches_bfs(name):
+    check_against_bfs(MAZES[name](), lambda solver, start, end: solver.solve_junction(start, end)[0])
+
+
+@pytest.mark.parametrize("name", sorted(MAZES))
+@pytest.mark.parametrize("algorithm", ["bfs", "a_star", "dijkstra", "bidirectional", "jps"])
+def test_solve_path_matches_bfs(name, algorithm):
+    def solve(solver, start, end):
+        path = solver.solve_path(start, end, algorithm)
+        assert path.dtype == np.int32 and path.shape[1:] == (2,)
+        return [tuple(cell) for cell in path.tolist()]
+    check_against_bfs(MAZES[name](), solve)
+
+
+def test_trace_bfs_yields_levels_then_returns_the_path():
+    solver = MazeSolver(MAZES["dfs_looped"]())
+    start, end = (0, 1), (30, 23)
+    trace = solver.trace_bfs(start, end)
+    levels = []
+    with pytest.raises(StopIteration) as stop:
+        while True:
+            levels.append(next(trace))
+    path = stop.value.value
+    assert path == solver.solve_bfs(start, end)[0]
+    assert levels[0] == [start] and end in levels[-1]
+    assert len(levels) == len(path)  # One level per step from the start
+
+
+@pytest.mark.parametrize("name", ["dfs", "dfs_looped"])
+def test_solve_many_matches_bfs(name):
+    maze = MAZES[name]()
+    solver = MazeSolver(maze)
+    pairs = open_pairs(maze, seed=3)
+    pairs += [(pairs[0][0], end) for _, end in pairs[:10]]  # Shared starts
+    expected = [solver.solve_bfs(start, end)[0] for start, end in pairs]
+    # A wall or outside cell at either end gives no path
+    pairs += [((0, 0), pairs[1][1]), (pairs[2][0], (-1, 5))]
+    assert solver.solve_many(pairs) == expected + [[], []]